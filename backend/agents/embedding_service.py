@@ -10,9 +10,20 @@ This service handles:
 
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timezone as dt_timezone
+
+import numpy as np
+import openai
+import tiktoken
+from asgiref.sync import sync_to_async
 from openai import AsyncOpenAI
 from django.conf import settings
 from django.utils import timezone
@@ -21,6 +32,15 @@ from common.models import ProcessedContent, Insight, PainPoint
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Encoder used by text-embedding-3-small; built lazily and cached.
+
+    tiktoken downloads the encoding file on first use, so this must not
+    run at import time.
+    """
+    return tiktoken.get_encoding("cl100k_base")
+
 
 class EmbeddingService:
     """
@@ -33,11 +53,192 @@ class EmbeddingService:
     - Error handling and retry logic
     """
 
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-        self.model = "text-embedding-3-small"  # 1536 dimensions, $0.02/1M tokens
-        self.dimensions = 1536
+    # Retry policy for rate limits and transient connection errors
+    max_retries = 5
+    max_backoff_seconds = 60.0
+
+    # Placeholder substituted for empty/whitespace-only inputs; its embedding
+    # is computed once per process and reused
+    EMPTY_TEXT = "No content available"
+
+    # Input limit of text-embedding-3-small, in tokens (not characters)
+    MAX_EMBED_TOKENS = 8191
+
+    def __init__(self, provider: str = 'openai'):
+        """
+        Args:
+            provider: 'openai' (default) calls the hosted embeddings API.
+                'onnx' runs sentence-transformers/all-MiniLM-L6-v2 locally on
+                CPU via ONNX Runtime — no network and no per-token cost, for
+                large background backfills. Requires the optional onnxruntime
+                and tokenizers packages plus an exported model directory
+                (EMBEDDING_ONNX_MODEL_DIR setting) containing model.onnx and
+                tokenizer.json. Note the local model produces 384-dim vectors,
+                so the target embedding column must be provisioned for that
+                dimension; rows are distinguished by their embedding_model
+                field.
+        """
+        self.provider = provider
+
+        if provider == 'onnx':
+            self._init_onnx()
+        elif provider == 'openai':
+            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.model = "text-embedding-3-small"  # 1536 dimensions, $0.02/1M tokens
+            self.dimensions = 1536
+        else:
+            raise ValueError(f"Unknown embedding provider: {provider}")
+
         self.batch_size = 100  # OpenAI allows up to 2048
+        self._empty_embedding: Optional[np.ndarray] = None
+        # Shared gate so a 429 pauses all in-flight embedding calls together
+        # instead of each concurrent batch hammering the API independently
+        self._api_semaphore = asyncio.Semaphore(4)
+
+    def _init_onnx(self):
+        """Load the local ONNX model and tokenizer once at service init."""
+        try:
+            import onnxruntime
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "The 'onnx' embedding provider requires the onnxruntime and "
+                "tokenizers packages (pip install onnxruntime tokenizers)"
+            ) from e
+
+        model_dir = getattr(settings, 'EMBEDDING_ONNX_MODEL_DIR', None)
+        if not model_dir:
+            raise ValueError(
+                "EMBEDDING_ONNX_MODEL_DIR setting is required for the 'onnx' "
+                "embedding provider"
+            )
+
+        self.model = "all-MiniLM-L6-v2"
+        self.dimensions = 384
+
+        self._tokenizer = Tokenizer.from_file(str(Path(model_dir) / 'tokenizer.json'))
+        self._tokenizer.enable_truncation(max_length=512)
+        self._tokenizer.enable_padding()
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = os.cpu_count() or 1
+        self._session = onnxruntime.InferenceSession(
+            str(Path(model_dir) / 'model.onnx'),
+            sess_options=session_options,
+            providers=['CPUExecutionProvider']
+        )
+
+    def _embed_onnx(self, texts: List[str]) -> tuple[np.ndarray, int]:
+        """Tokenize + forward pass + mean pooling on CPU. Runs synchronously."""
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+
+        inputs = {'input_ids': input_ids, 'attention_mask': attention_mask}
+        if any(i.name == 'token_type_ids' for i in self._session.get_inputs()):
+            inputs['token_type_ids'] = np.zeros_like(input_ids)
+
+        token_embeddings = self._session.run(None, inputs)[0]
+
+        # Masked mean pooling + L2 normalization (standard for MiniLM)
+        mask = attention_mask[:, :, np.newaxis].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-9, None)
+
+        return pooled.astype(np.float32), int(attention_mask.sum())
+
+    def _copy_update_embeddings(self, model_cls, items, embeddings):
+        """
+        Bulk-write embeddings via Postgres COPY to a temp table plus a single
+        UPDATE ... FROM, instead of one UPDATE per row.
+
+        For first-time embedding of a large corpus there is no row contention
+        (the embedding column is NULL), and COPY is the highest-throughput
+        write path Postgres offers. Runs synchronously; callers wrap it in
+        sync_to_async.
+        """
+        from django.db import connection
+
+        table = connection.ops.quote_name(model_cls._meta.db_table)
+        now = timezone.now()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS embedding_tmp "
+                "(id uuid PRIMARY KEY, embedding vector)"
+            )
+
+            # Django's cursor wrapper does not expose psycopg3's COPY API;
+            # use the underlying cursor for the stream
+            with cursor.cursor.copy(
+                "COPY embedding_tmp (id, embedding) FROM STDIN"
+            ) as copy:
+                for item, embedding in zip(items, embeddings):
+                    vector_literal = '[' + ','.join(map(str, embedding)) + ']'
+                    copy.write_row((str(item.id), vector_literal))
+
+            cursor.execute(
+                f"UPDATE {table} t "
+                "SET embedding = e.embedding, "
+                "    embedding_model = %s, "
+                "    embedding_created_at = %s "
+                "FROM embedding_tmp e WHERE t.id = e.id",
+                [self.model, now]
+            )
+            cursor.execute("TRUNCATE embedding_tmp")
+
+    @staticmethod
+    def _retry_after_seconds(error: Exception) -> Optional[float]:
+        """Extract a server-suggested delay from a Retry-After header, if any."""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+
+        retry_after = response.headers.get('retry-after')
+        if not retry_after:
+            return None
+
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+        # Retry-After may also be an HTTP-date
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, (retry_at - datetime.now(dt_timezone.utc)).total_seconds())
+        except (ValueError, TypeError):
+            return None
+
+    async def _call_with_retry(self, texts):
+        """
+        Call the embeddings API, retrying on rate limits and connection errors.
+
+        Backs off exponentially with jitter, honoring the server's Retry-After
+        header when present, so a single 429 doesn't abort a whole embed job.
+        Uses asyncio.sleep so the event loop stays free while waiting.
+        """
+        async with self._api_semaphore:
+            for attempt in range(self.max_retries):
+                try:
+                    return await self.client.embeddings.create(
+                        model=self.model,
+                        input=texts,
+                        dimensions=self.dimensions
+                    )
+                except (openai.RateLimitError, openai.APIConnectionError) as e:
+                    if attempt == self.max_retries - 1:
+                        raise
+
+                    delay = self._retry_after_seconds(e)
+                    if delay is None:
+                        delay = min(self.max_backoff_seconds, 2 ** attempt) + random.uniform(0, 1)
+
+                    logger.warning(
+                        f"Embeddings API call failed ({type(e).__name__}), "
+                        f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    await asyncio.sleep(delay)
 
     async def generate_embedding(self, text: str) -> List[float]:
         """
@@ -47,29 +248,71 @@ class EmbeddingService:
             text: Text to embed
 
         Returns:
-            List of floats (embedding vector)
+            List of floats (embedding vector). Plain floats, not a numpy
+            row: single embeddings feed RawSQL vector-search params, and
+            psycopg has no adapter for ndarray.
         """
         try:
-            # Truncate text to fit token limits (8191 tokens for text-embedding-3-small)
-            text = text[:8000]  # ~8000 chars ≈ 2000 tokens (safe limit)
+            text = self._truncate_to_token_limit(text or "")
 
             if not text.strip():
                 logger.warning("Empty text provided for embedding, using placeholder")
-                text = "No content available"
-
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=text,
-                dimensions=self.dimensions
-            )
+                if self._empty_embedding is None:
+                    placeholder, _ = await self._embed_texts([self.EMPTY_TEXT])
+                    self._empty_embedding = placeholder[0]
+                return self._empty_embedding.tolist()
 
-            return response.data[0].embedding
+            embeddings, _ = await self._embed_texts([text])
+            return embeddings[0].tolist()
 
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise
 
-    async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    @classmethod
+    def _truncate_to_token_limit(cls, text: str) -> str:
+        """
+        Truncate text to the model's token limit using the real tokenizer.
+
+        A character slice over-truncates badly — the model accepts 8191
+        tokens (~32K chars of English), so cutting at 8000 chars throws away
+        up to 75% of the usable signal. A text can't exceed N tokens with
+        fewer than N characters, so short inputs skip tokenization entirely.
+        """
+        if len(text) <= cls.MAX_EMBED_TOKENS:
+            return text
+
+        encoder = _get_encoder()
+        tokens = encoder.encode_ordinary(text)
+        if len(tokens) <= cls.MAX_EMBED_TOKENS:
+            return text
+        return encoder.decode(tokens[:cls.MAX_EMBED_TOKENS])
+
+    async def _embed_texts(self, texts: List[str]) -> tuple[np.ndarray, int]:
+        """Embed already-validated texts via the configured provider."""
+        if self.provider == 'onnx':
+            # Forward pass is CPU-bound; run it off the event loop
+            return await asyncio.to_thread(self._embed_onnx, texts)
+
+        response = await self._call_with_retry(texts)
+
+        # Prefer the provider-reported token count; a word-count estimate
+        # can be off by 20-50% on non-English or URL-heavy content
+        if response.usage:
+            total_tokens = response.usage.total_tokens
+        else:
+            encoder = _get_encoder()
+            total_tokens = sum(len(encoder.encode_ordinary(text)) for text in texts)
+
+        # The embeddings endpoint returns data in request order, so no
+        # re-sort is needed. A contiguous float32 array is ~8x smaller
+        # than 1536 boxed Python floats per vector, and pgvector's
+        # VectorField accepts numpy rows directly.
+        if settings.DEBUG:
+            assert all(d.index == i for i, d in enumerate(response.data))
+        return np.asarray([d.embedding for d in response.data], dtype=np.float32), total_tokens
+
+    async def generate_embeddings_batch(self, texts: List[str]) -> tuple[np.ndarray, int]:
         """
         Generate embeddings for multiple texts in batch.
 
@@ -77,54 +320,85 @@ class EmbeddingService:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            Tuple of (float32 array of shape (len(texts), dimensions),
+            total tokens billed for the batch)
         """
         try:
-            # Truncate all texts and handle empty texts
-            processed_texts = []
-            for text in texts:
-                text = text[:8000] if text else "No content available"
-                if not text.strip():
-                    text = "No content available"
-                processed_texts.append(text)
-
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=processed_texts,
-                dimensions=self.dimensions
-            )
+            # Truncate texts and partition out empty/whitespace rows: those
+            # all map to the same placeholder vector, which is embedded once
+            # per process and scattered in locally instead of spending an API
+            # slot per empty row per batch.
+            call_indices = []
+            call_texts = []
+            empty_indices = []
+            for idx, text in enumerate(texts):
+                text = self._truncate_to_token_limit(text or "")
+                if text.strip():
+                    call_indices.append(idx)
+                    call_texts.append(text)
+                else:
+                    empty_indices.append(idx)
+
+            embeddings = np.empty((len(texts), self.dimensions), dtype=np.float32)
+            total_tokens = 0
+
+            if empty_indices:
+                if self._empty_embedding is None:
+                    placeholder, _ = await self._embed_texts([self.EMPTY_TEXT])
+                    self._empty_embedding = placeholder[0]
+                embeddings[empty_indices] = self._empty_embedding
 
-            # Sort by index to maintain order
-            embeddings = sorted(response.data, key=lambda x: x.index)
-            return [emb.embedding for emb in embeddings]
+            if call_texts:
+                vectors, total_tokens = await self._embed_texts(call_texts)
+                embeddings[call_indices] = vectors
+
+            return embeddings, total_tokens
 
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {e}")
             raise
 
-    async def embed_processed_content(
+    async def _embed_queryset(
         self,
-        content_ids: Optional[List[str]] = None,
+        model_cls,
+        text_fn: Callable[[Any], str],
+        only_fields: tuple,
+        ids: Optional[List[str]] = None,
         force_regenerate: bool = False,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        label: str = "items",
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        use_copy: bool = False
     ) -> Dict[str, Any]:
         """
-        Generate embeddings for ProcessedContent records.
+        Generate embeddings for one model's records.
+
+        Shared implementation behind embed_processed_content/embed_insights/
+        embed_pain_points, parameterized by the model class and a text
+        extractor so streaming, batching and cost tracking live in one place.
 
         Args:
-            content_ids: Optional list of specific IDs to embed
+            model_cls: Django model with embedding/embedding_model/embedding_created_at fields
+            text_fn: Extracts the text to embed from a model instance
+            only_fields: Columns (besides id) the text extractor needs
+            ids: Optional list of specific IDs to embed
             force_regenerate: If True, regenerate even if embeddings exist
             limit: Maximum number of items to process
+            label: Human-readable name for log messages
+            progress_cb: Optional callback receiving (embedded_count,
+                total_tokens) after each batch, for callers that want to
+                push metrics without log I/O
+            use_copy: Write batches via COPY + UPDATE FROM instead of
+                per-row saves — much faster for first-time bulk embeds
 
         Returns:
             Stats dict with counts and cost
         """
         try:
-            # Query content needing embeddings
-            queryset = ProcessedContent.objects.all()
+            queryset = model_cls.objects.all()
 
-            if content_ids:
-                queryset = queryset.filter(id__in=content_ids)
+            if ids:
+                queryset = queryset.filter(id__in=ids)
 
             if not force_regenerate:
                 queryset = queryset.filter(embedding__isnull=True)
@@ -132,102 +406,77 @@ class EmbeddingService:
             if limit:
                 queryset = queryset[:limit]
 
-            content_items = list(queryset)
-
-            if not content_items:
-                logger.info("No ProcessedContent items need embedding")
-                return {"embedded": 0, "skipped": 0, "cost": 0.0}
+            # Stream rows in chunks and only fetch the columns needed for
+            # embedding, instead of materializing every row (including
+            # unrelated JSON fields) in memory at once. Peak memory is
+            # bounded by batch_size rather than the full result set.
+            queryset = queryset.only('id', *only_fields)
 
-            logger.info(f"Generating embeddings for {len(content_items)} ProcessedContent items")
-
-            # Process in batches
             embedded_count = 0
             total_tokens = 0
+            batch_idx = 0
+
+            # Run ORM reads/writes on the threadpool (thread_sensitive=False)
+            # so each gets its own DB connection. Otherwise the three embed_all
+            # tasks serialize on the shared connection despite asyncio.gather.
+            iterator = queryset.iterator(chunk_size=500)
+            fetch_batch = sync_to_async(
+                lambda: list(islice(iterator, self.batch_size)),
+                thread_sensitive=False
+            )
 
-            for i in range(0, len(content_items), self.batch_size):
-                batch = content_items[i:i + self.batch_size]
-                texts = [item.cleaned_content for item in batch]
-
-                # Generate embeddings
-                embeddings = await self.generate_embeddings_batch(texts)
-
-                # Update database
+            def _save_batch(batch, embeddings):
+                if use_copy:
+                    self._copy_update_embeddings(model_cls, batch, embeddings)
+                    return
                 for item, embedding in zip(batch, embeddings):
                     item.embedding = embedding
                     item.embedding_model = self.model
                     item.embedding_created_at = timezone.now()
                     item.save(update_fields=['embedding', 'embedding_model', 'embedding_created_at'])
 
-                embedded_count += len(batch)
-                # Rough token estimate: words * 1.3 tokens/word
-                total_tokens += sum(len(text.split()) * 1.3 for text in texts)
-
-                logger.info(f"Embedded batch {i//self.batch_size + 1}/{(len(content_items)-1)//self.batch_size + 1}")
-
-            # Calculate cost: $0.02 per 1M tokens
-            cost = (total_tokens / 1_000_000) * 0.02
-
-            return {
-                "embedded": embedded_count,
-                "skipped": 0,
-                "total_tokens": int(total_tokens),
-                "cost": round(cost, 4),
-                "model": self.model
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to embed ProcessedContent: {e}")
-            raise
-
-    async def embed_insights(
-        self,
-        insight_ids: Optional[List[str]] = None,
-        force_regenerate: bool = False,
-        limit: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Generate embeddings for Insight records."""
-        try:
-            queryset = Insight.objects.all()
-
-            if insight_ids:
-                queryset = queryset.filter(id__in=insight_ids)
+            save_batch = sync_to_async(_save_batch, thread_sensitive=False)
 
-            if not force_regenerate:
-                queryset = queryset.filter(embedding__isnull=True)
+            # Time-based progress logging: a per-batch logger.info means one
+            # synchronous file write per batch (10K writes on a 1M-row
+            # backfill), so only log every few seconds plus a final summary
+            last_log = time.monotonic()
 
-            if limit:
-                queryset = queryset[:limit]
-
-            insights = list(queryset)
+            while True:
+                batch = await fetch_batch()
+                if not batch:
+                    break
 
-            if not insights:
-                logger.info("No Insights need embedding")
-                return {"embedded": 0, "skipped": 0, "cost": 0.0}
+                texts = [text_fn(item) for item in batch]
 
-            logger.info(f"Generating embeddings for {len(insights)} Insights")
+                # Generate embeddings
+                embeddings, batch_tokens = await self.generate_embeddings_batch(texts)
 
-            embedded_count = 0
-            total_tokens = 0
+                # Update database
+                await save_batch(batch, embeddings)
 
-            for i in range(0, len(insights), self.batch_size):
-                batch = insights[i:i + self.batch_size]
-                # Combine title + description for richer embeddings
-                texts = [f"{item.title}\n\n{item.description}" for item in batch]
+                embedded_count += len(batch)
+                total_tokens += batch_tokens
+                batch_idx += 1
 
-                embeddings = await self.generate_embeddings_batch(texts)
+                if progress_cb:
+                    progress_cb(embedded_count, total_tokens)
 
-                for item, embedding in zip(batch, embeddings):
-                    item.embedding = embedding
-                    item.embedding_model = self.model
-                    item.embedding_created_at = timezone.now()
-                    item.save(update_fields=['embedding', 'embedding_model', 'embedding_created_at'])
+                now = time.monotonic()
+                if now - last_log > 5.0:
+                    logger.info(f"Embedded batch {batch_idx} ({embedded_count} {label} so far)")
+                    last_log = now
 
-                embedded_count += len(batch)
-                total_tokens += sum(len(text.split()) * 1.3 for text in texts)
+            if embedded_count:
+                logger.info(f"Embedded {embedded_count} {label} in {batch_idx} batches")
 
-                logger.info(f"Embedded batch {i//self.batch_size + 1}/{(len(insights)-1)//self.batch_size + 1}")
+            if not embedded_count:
+                logger.info(f"No {label} need embedding")
+                return {"embedded": 0, "skipped": 0, "total_tokens": 0,
+                        "cost": 0.0, "model": self.model}
 
-            cost = (total_tokens / 1_000_000) * 0.02
+            # Calculate cost: $0.02 per 1M tokens (local inference is free)
+            cost = (total_tokens / 1_000_000) * 0.02 if self.provider == 'openai' else 0.0
 
             return {
                 "embedded": embedded_count,
@@ -238,73 +487,83 @@ class EmbeddingService:
             }
 
         except Exception as e:
-            logger.error(f"Failed to embed Insights: {e}")
+            logger.error(f"Failed to embed {label}: {e}")
             raise
 
-    async def embed_pain_points(
+    async def embed_processed_content(
         self,
-        pain_point_ids: Optional[List[str]] = None,
+        content_ids: Optional[List[str]] = None,
         force_regenerate: bool = False,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        use_copy: bool = False
     ) -> Dict[str, Any]:
-        """Generate embeddings for PainPoint records."""
-        try:
-            queryset = PainPoint.objects.all()
-
-            if pain_point_ids:
-                queryset = queryset.filter(id__in=pain_point_ids)
-
-            if not force_regenerate:
-                queryset = queryset.filter(embedding__isnull=True)
-
-            if limit:
-                queryset = queryset[:limit]
-
-            pain_points = list(queryset)
-
-            if not pain_points:
-                logger.info("No PainPoints need embedding")
-                return {"embedded": 0, "skipped": 0, "cost": 0.0}
-
-            logger.info(f"Generating embeddings for {len(pain_points)} PainPoints")
-
-            embedded_count = 0
-            total_tokens = 0
-
-            for i in range(0, len(pain_points), self.batch_size):
-                batch = pain_points[i:i + self.batch_size]
-                # Use keyword + context
-                texts = [
-                    f"{item.keyword}\n{item.example_content}" if item.example_content else item.keyword
-                    for item in batch
-                ]
-
-                embeddings = await self.generate_embeddings_batch(texts)
-
-                for item, embedding in zip(batch, embeddings):
-                    item.embedding = embedding
-                    item.embedding_model = self.model
-                    item.embedding_created_at = timezone.now()
-                    item.save(update_fields=['embedding', 'embedding_model', 'embedding_created_at'])
-
-                embedded_count += len(batch)
-                total_tokens += sum(len(text.split()) * 1.3 for text in texts)
+        """
+        Generate embeddings for ProcessedContent records.
 
-                logger.info(f"Embedded batch {i//self.batch_size + 1}/{(len(pain_points)-1)//self.batch_size + 1}")
+        Args:
+            content_ids: Optional list of specific IDs to embed
+            force_regenerate: If True, regenerate even if embeddings exist
+            limit: Maximum number of items to process
 
-            cost = (total_tokens / 1_000_000) * 0.02
+        Returns:
+            Stats dict with counts and cost
+        """
+        return await self._embed_queryset(
+            ProcessedContent,
+            lambda item: item.cleaned_content,
+            only_fields=('cleaned_content',),
+            ids=content_ids,
+            force_regenerate=force_regenerate,
+            limit=limit,
+            label="ProcessedContent items",
+            progress_cb=progress_cb,
+            use_copy=use_copy
+        )
 
-            return {
-                "embedded": embedded_count,
-                "skipped": 0,
-                "total_tokens": int(total_tokens),
-                "cost": round(cost, 4),
-                "model": self.model
-            }
+    async def embed_insights(
+        self,
+        insight_ids: Optional[List[str]] = None,
+        force_regenerate: bool = False,
+        limit: Optional[int] = None,
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        use_copy: bool = False
+    ) -> Dict[str, Any]:
+        """Generate embeddings for Insight records."""
+        # Combine title + description for richer embeddings
+        return await self._embed_queryset(
+            Insight,
+            lambda item: f"{item.title}\n\n{item.description}",
+            only_fields=('title', 'description'),
+            ids=insight_ids,
+            force_regenerate=force_regenerate,
+            limit=limit,
+            label="Insights",
+            progress_cb=progress_cb,
+            use_copy=use_copy
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to embed PainPoints: {e}")
-            raise
+    async def embed_pain_points(
+        self,
+        pain_point_ids: Optional[List[str]] = None,
+        force_regenerate: bool = False,
+        limit: Optional[int] = None,
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        use_copy: bool = False
+    ) -> Dict[str, Any]:
+        """Generate embeddings for PainPoint records."""
+        # Use keyword + context
+        return await self._embed_queryset(
+            PainPoint,
+            lambda item: f"{item.keyword}\n{item.example_content}" if item.example_content else item.keyword,
+            only_fields=('keyword', 'example_content'),
+            ids=pain_point_ids,
+            force_regenerate=force_regenerate,
+            limit=limit,
+            label="PainPoints",
+            progress_cb=progress_cb,
+            use_copy=use_copy
+        )
 
     async def embed_all(
         self,
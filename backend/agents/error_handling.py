@@ -5,13 +5,24 @@ This module provides advanced error handling, recovery strategies,
 and graceful degradation for the EchoChamber workflow system.
 """
 
+import asyncio
+import heapq
+import json
 import logging
+import queue
+from bisect import bisect_left
+from itertools import islice
+import threading
+import time
 import traceback
-from typing import Dict, List, Any, Optional, Callable
+from collections import defaultdict, deque
+from typing import Dict, List, Any, Optional, Callable, Type
 from datetime import datetime, timedelta
 from functools import wraps
 from enum import Enum
+from types import MappingProxyType
 
+import numpy as np
 from django.core.cache import cache
 from django.utils import timezone
 
@@ -39,6 +50,13 @@ class RecoveryStrategy(str, Enum):
 class ErrorContext:
     """Context information for error handling."""
 
+    # Slots halve per-instance memory and make attribute access a C-level
+    # descriptor — the ring buffer holds up to 1000 of these
+    __slots__ = (
+        'error', 'operation', 'component', 'severity', 'metadata',
+        'timestamp', 'timestamp_epoch', '_stack_trace'
+    )
+
     def __init__(
         self,
         error: Exception,
@@ -53,25 +71,68 @@ class ErrorContext:
         self.severity = severity
         self.metadata = metadata or {}
         self.timestamp = datetime.now()
-        self.stack_trace = traceback.format_exc()
+        self.timestamp_epoch = self.timestamp.timestamp()
+        self._stack_trace = None
+
+    @property
+    def stack_trace(self) -> str:
+        """Formatted traceback, built lazily and memoized.
+
+        Formatting walks the traceback and builds a multi-KB string, so it
+        only happens when a consumer (logging, cache, DB escalation) actually
+        reads it — not for every context on the hot path.
+        """
+        if self._stack_trace is None:
+            self._stack_trace = ''.join(traceback.format_exception(
+                type(self.error), self.error, self.error.__traceback__
+            ))
+        return self._stack_trace
+
+    def to_dict(self, lightweight: bool = False) -> Dict[str, Any]:
+        """Convert error context to dictionary.
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error context to dictionary."""
-        return {
+        Args:
+            lightweight: Omit the stack trace and truncate metadata values
+                to 256 chars. The multi-KB trace dominates serialization
+                bytes on the dashboard-cache path, which only displays the
+                summary fields; the full payload is reserved for DB
+                escalation.
+        """
+        data = {
             'error_type': type(self.error).__name__,
             'error_message': str(self.error),
             'operation': self.operation,
             'component': self.component,
             'severity': self.severity.value,
             'timestamp': self.timestamp.isoformat(),
-            'metadata': self.metadata,
-            'stack_trace': self.stack_trace
+            # Pre-computed epoch so time filtering is a float compare rather
+            # than a fromisoformat parse per entry
+            'timestamp_epoch': self.timestamp_epoch,
         }
 
+        if lightweight:
+            # Copy (not alias) the metadata so later caller mutations can't
+            # corrupt what was cached
+            data['metadata'] = {
+                key: value[:256] if isinstance(value, str) else value
+                for key, value in self.metadata.items()
+            }
+        else:
+            data['metadata'] = self.metadata
+            data['stack_trace'] = self.stack_trace
+
+        return data
+
 
 class CircuitBreaker:
     """Circuit breaker pattern for preventing cascading failures."""
 
+    __slots__ = (
+        'failure_threshold', 'recovery_timeout', 'expected_exception',
+        'failure_count', 'last_failure_time', 'opened_at', 'state',
+        '_lock', '_half_open_probe'
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -82,87 +143,241 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
         self.failure_count = 0
+        # Monotonic seconds: immune to NTP/DST wall-clock jumps and cheaper
+        # than datetime arithmetic on the failure path
         self.last_failure_time = None
+        # Wall-clock timestamp kept only for display, set when the breaker
+        # opens (cold path)
+        self.opened_at = None
         self.state = "closed"  # closed, open, half_open
+        # Guards grouped (state, failure_count, last_failure_time) updates so
+        # concurrent callers can't make illegal transitions
+        self._lock = threading.Lock()
+        # True while one caller holds the half-open probe; others see OPEN
+        self._half_open_probe = False
+
+    def _open_error(self) -> Exception:
+        return Exception(f"Circuit breaker is OPEN. Service unavailable. Last failure: {self.opened_at}")
+
+    def _admit(self):
+        """Gate entry to the protected call; raises while the circuit is open."""
+        with self._lock:
+            if self.state == "open":
+                # Only the first caller past the recovery timeout gets to
+                # probe; the rest keep failing fast instead of stampeding
+                # the recovering service
+                if self._should_attempt_reset() and not self._half_open_probe:
+                    self.state = "half_open"
+                    self._half_open_probe = True
+                else:
+                    raise self._open_error()
+            elif self.state == "half_open" and self._half_open_probe:
+                raise self._open_error()
+
+    def _record_success(self):
+        """Close the circuit after a successful half-open probe."""
+        with self._lock:
+            if self.state == "half_open":
+                self._reset()
+
+    def _release_probe(self):
+        """Hand the half-open probe back without a verdict.
+
+        Used when the call raises something outside expected_exception:
+        that says nothing about the protected service, but leaving the
+        probe flag set would block every future probe and wedge the
+        breaker open permanently.
+        """
+        with self._lock:
+            self._half_open_probe = False
 
     def call(self, func: Callable, *args, **kwargs):
-        """Execute function with circuit breaker protection."""
-        if self.state == "open":
-            if self._should_attempt_reset():
-                self.state = "half_open"
-            else:
-                raise Exception(f"Circuit breaker is OPEN. Service unavailable. Last failure: {self.last_failure_time}")
+        """Execute a sync function with circuit breaker protection."""
+        self._admit()
 
         try:
             result = func(*args, **kwargs)
+        except self.expected_exception:
+            self._record_failure()
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
 
-            if self.state == "half_open":
-                self._reset()
+        self._record_success()
+        return result
 
-            return result
+    async def acall(self, func: Callable, *args, **kwargs):
+        """Execute an async function with circuit breaker protection.
 
-        except self.expected_exception as e:
+        The coroutine is awaited inside the try block so failures raised
+        at await time are recorded; calling the sync ``call`` with an
+        async function would return the coroutine before it ever ran and
+        the breaker would never see the outcome.
+        """
+        self._admit()
+
+        try:
+            result = await func(*args, **kwargs)
+        except self.expected_exception:
             self._record_failure()
             raise
+        except BaseException:
+            self._release_probe()
+            raise
+
+        self._record_success()
+        return result
 
     def _record_failure(self):
         """Record a failure and potentially open the circuit."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now()
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            was_half_open = self._half_open_probe
+            self._half_open_probe = False
 
-        if self.failure_count >= self.failure_threshold:
-            self.state = "open"
-            logger.error(f"Circuit breaker opened after {self.failure_count} failures")
+            if (was_half_open or self.failure_count >= self.failure_threshold) and self.state != "open":
+                self.state = "open"
+                self.opened_at = datetime.now()
+                logger.error("Circuit breaker opened after %s failures", self.failure_count)
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
-        if not self.last_failure_time:
+        if self.last_failure_time is None:
             return True
 
-        elapsed = (datetime.now() - self.last_failure_time).total_seconds()
-        return elapsed >= self.recovery_timeout
+        return time.monotonic() - self.last_failure_time >= self.recovery_timeout
 
     def _reset(self):
-        """Reset the circuit breaker."""
+        """Reset the circuit breaker. Caller must hold self._lock."""
         self.failure_count = 0
         self.last_failure_time = None
+        self.opened_at = None
         self.state = "closed"
+        self._half_open_probe = False
         logger.info("Circuit breaker reset to CLOSED state")
 
 
+# Recovery strategies shared by all service instances. Keyed by exception
+# class where the type is importable here (isinstance also covers
+# subclasses), with a name-keyed map for exception types this module should
+# not import (OpenAI, Django, business errors).
+_STRATEGY_BY_CLASS = (
+    (ConnectionError, RecoveryStrategy.RETRY),
+    (TimeoutError, RecoveryStrategy.RETRY),
+    (MemoryError, RecoveryStrategy.ABORT),
+    (SystemError, RecoveryStrategy.ESCALATE),
+)
+
+_STRATEGY_BY_NAME = MappingProxyType({
+    # Network and API errors
+    'ConnectionError': RecoveryStrategy.RETRY,
+    'TimeoutError': RecoveryStrategy.RETRY,
+    'HTTPError': RecoveryStrategy.RETRY,
+
+    # LLM errors
+    'RateLimitError': RecoveryStrategy.GRACEFUL_DEGRADATION,
+    'InvalidRequestError': RecoveryStrategy.FALLBACK,
+    'APIError': RecoveryStrategy.RETRY,
+
+    # Data errors
+    'ValidationError': RecoveryStrategy.SKIP_AND_CONTINUE,
+    'IntegrityError': RecoveryStrategy.SKIP_AND_CONTINUE,
+
+    # Critical errors
+    'MemoryError': RecoveryStrategy.ABORT,
+    'SystemError': RecoveryStrategy.ESCALATE,
+
+    # Business logic errors
+    'BudgetExceededError': RecoveryStrategy.ABORT,
+    'DataNotFoundError': RecoveryStrategy.FALLBACK,
+})
+
+
+# Severity -> (logger method, message template) dispatch, resolved once
+# instead of a four-branch comparison chain per logged error
+_LOG_BY_SEVERITY = {
+    ErrorSeverity.CRITICAL: (logger.critical, "CRITICAL ERROR in %s.%s: %s"),
+    ErrorSeverity.HIGH: (logger.error, "ERROR in %s.%s: %s"),
+    ErrorSeverity.MEDIUM: (logger.warning, "WARNING in %s.%s: %s"),
+    ErrorSeverity.LOW: (logger.info, "INFO in %s.%s: %s"),
+}
+
+
+# Position of each severity in the columnar severity array / bincount output
+_SEVERITY_ORDER = tuple(ErrorSeverity)
+_SEVERITY_INDEX = {severity: code for code, severity in enumerate(_SEVERITY_ORDER)}
+
+
+class _LogShard:
+    """Per-thread slice of the error ring buffer.
+
+    Alongside the contexts, each shard keeps columnar (structure-of-arrays)
+    deques of small-int codes for severity, component and error type, so
+    statistics aggregate over integer columns with np.bincount instead of
+    looping over contexts in Python.
+
+    Only the owning thread appends, but readers merging shards iterate the
+    deques from other threads; ``lock`` is held for the append and for each
+    snapshot so a concurrent append can't mutate a deque mid-iteration.
+    """
+
+    __slots__ = ('contexts', 'timestamps', 'severity_codes',
+                 'component_codes', 'type_codes', 'lock')
+
+    def __init__(self, maxlen: int):
+        self.contexts = deque(maxlen=maxlen)
+        self.timestamps = deque(maxlen=maxlen)
+        self.severity_codes = deque(maxlen=maxlen)
+        self.component_codes = deque(maxlen=maxlen)
+        self.type_codes = deque(maxlen=maxlen)
+        self.lock = threading.Lock()
+
+
 class ErrorHandlingService:
     """Central error handling service with recovery strategies."""
 
+    # Capacity of the in-memory error ring buffer
+    ERROR_LOG_MAXLEN = 1000
+
+    # Dashboard-cache write coalescing: flush a bucket once it holds this
+    # many entries, or when this many seconds have passed since last flush
+    CACHE_FLUSH_COUNT = 32
+    CACHE_FLUSH_SECONDS = 5.0
+
+    # Escalation DB writes: queue bound and bulk_create batch size
+    ESCALATION_QUEUE_SIZE = 512
+    ESCALATION_BATCH_SIZE = 50
+
     def __init__(self):
-        self.error_log = []
+        # The error log is sharded per thread: each worker appends to its own
+        # fixed-capacity ring buffer (no cross-thread contention on the hot
+        # path) and readers merge the shards on demand. Each shard pairs the
+        # context deque with a parallel deque of epoch floats so time-window
+        # queries can binary-search instead of comparing per entry.
+        self._log_shards: List[_LogShard] = []
+        self._shards_lock = threading.Lock()
+        self._local = threading.local()
+        # Dictionary-encoding tables for the columnar stats arrays: small
+        # string (component / error-type name) -> int code, plus the reverse
+        # list for decoding bincount output back to names
+        self._component_ids: Dict[str, int] = {}
+        self._component_names: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+        self._type_names: List[str] = []
         self.circuit_breakers = {}
-        self.recovery_strategies = self._setup_recovery_strategies()
-
-    def _setup_recovery_strategies(self) -> Dict[str, RecoveryStrategy]:
-        """Setup recovery strategies for different error types."""
-        return {
-            # Network and API errors
-            'ConnectionError': RecoveryStrategy.RETRY,
-            'TimeoutError': RecoveryStrategy.RETRY,
-            'HTTPError': RecoveryStrategy.RETRY,
-
-            # LLM errors
-            'RateLimitError': RecoveryStrategy.GRACEFUL_DEGRADATION,
-            'InvalidRequestError': RecoveryStrategy.FALLBACK,
-            'APIError': RecoveryStrategy.RETRY,
-
-            # Data errors
-            'ValidationError': RecoveryStrategy.SKIP_AND_CONTINUE,
-            'IntegrityError': RecoveryStrategy.SKIP_AND_CONTINUE,
-
-            # Critical errors
-            'MemoryError': RecoveryStrategy.ABORT,
-            'SystemError': RecoveryStrategy.ESCALATE,
-
-            # Business logic errors
-            'BudgetExceededError': RecoveryStrategy.ABORT,
-            'DataNotFoundError': RecoveryStrategy.FALLBACK,
-        }
+        self.recovery_strategies = _STRATEGY_BY_NAME
+        self._cache_buffer = defaultdict(list)
+        self._cache_buffer_lock = threading.Lock()
+        self._cache_last_flush = time.monotonic()
+        # Last-computed cache-key hour bucket: (hour number, '%Y%m%d%H'
+        # string), so bursts within the same hour skip the strftime call
+        self._hour_bucket = (-1, '')
+        self._redis = None  # lazily created; False once deemed unavailable
+        self._escalation_queue = queue.Queue(maxsize=self.ESCALATION_QUEUE_SIZE)
+        self._escalation_thread = None
+        self._escalation_thread_lock = threading.Lock()
 
     def handle_error(
         self,
@@ -200,32 +415,95 @@ class ErrorHandlingService:
 
     def _log_error(self, context: ErrorContext):
         """Log error to storage and monitoring systems."""
-        # Add to in-memory log
-        self.error_log.append(context.to_dict())
-
-        # Keep only last 1000 errors
-        if len(self.error_log) > 1000:
-            self.error_log = self.error_log[-1000:]
-
-        # Log based on severity
-        if context.severity == ErrorSeverity.CRITICAL:
-            logger.critical(f"CRITICAL ERROR in {context.component}.{context.operation}: {context.error}")
+        # Add to this thread's shard of the in-memory log; each shard's
+        # maxlen bounds it automatically. The ErrorContext itself is stored —
+        # dict materialization (including the stack trace) happens only when
+        # a consumer asks for it, and keeping contexts avoids pinning a
+        # serialized copy of every metadata/stack_trace string in memory.
+        shard = self._get_shard()
+        severity_code = _SEVERITY_INDEX[context.severity]
+        component_code = self._intern(
+            self._component_ids, self._component_names, context.component)
+        type_code = self._intern(
+            self._type_ids, self._type_names, type(context.error).__name__)
+        with shard.lock:
+            shard.contexts.append(context)
+            shard.timestamps.append(context.timestamp_epoch)
+            shard.severity_codes.append(severity_code)
+            shard.component_codes.append(component_code)
+            shard.type_codes.append(type_code)
+
+        # Log via the precompiled severity dispatch; %s args mean logging
+        # only formats (and only str()s the exception) if a handler emits
+        log_fn, message = _LOG_BY_SEVERITY[context.severity]
+        log_fn(message, context.component, context.operation, context.error)
+        if context.severity is ErrorSeverity.CRITICAL:
             logger.critical(context.stack_trace)
-        elif context.severity == ErrorSeverity.HIGH:
-            logger.error(f"ERROR in {context.component}.{context.operation}: {context.error}")
-        elif context.severity == ErrorSeverity.MEDIUM:
-            logger.warning(f"WARNING in {context.component}.{context.operation}: {context.error}")
-        else:
-            logger.info(f"INFO in {context.component}.{context.operation}: {context.error}")
 
-        # Cache error for monitoring dashboard
-        cache_key = f"error_log:{context.component}:{datetime.now().strftime('%Y%m%d%H')}"
-        try:
-            existing_errors = cache.get(cache_key, [])
-            existing_errors.append(context.to_dict())
-            cache.set(cache_key, existing_errors, 3600)  # 1 hour TTL
-        except Exception as e:
-            logger.warning(f"Failed to cache error: {e}")
+        # Cache error for monitoring dashboard. Writes are coalesced
+        # in-process: buffering costs a list append here, and the cache
+        # round-trips happen once per batch instead of twice per error.
+        hour = int(context.timestamp_epoch) // 3600
+        cached_hour, hour_suffix = self._hour_bucket
+        if hour != cached_hour:
+            hour_suffix = context.timestamp.strftime('%Y%m%d%H')
+            self._hour_bucket = (hour, hour_suffix)
+        cache_key = f"error_log:{context.component}:{hour_suffix}"
+        entry = context.to_dict(lightweight=True)
+        # The buffer is shared across threads; the lock keeps an append from
+        # racing the swap in _flush_cache_buffer and landing in a dict that
+        # has already been handed off for flushing.
+        with self._cache_buffer_lock:
+            bucket = self._cache_buffer[cache_key]
+            bucket.append(entry)
+            flush_due = (len(bucket) >= self.CACHE_FLUSH_COUNT
+                         or time.monotonic() - self._cache_last_flush > self.CACHE_FLUSH_SECONDS)
+
+        if flush_due:
+            self._flush_cache_buffer()
+
+    def _get_redis(self):
+        """Redis client for the error-log buckets, or None if unavailable."""
+        if self._redis is None:
+            try:
+                import redis as redis_lib
+                from django.conf import settings
+                self._redis = redis_lib.Redis.from_url(settings.REDIS_URL)
+            except Exception as e:
+                logger.warning("Redis unavailable for error log, using cache fallback: %s", e)
+                self._redis = False
+        return self._redis or None
+
+    def _flush_cache_buffer(self):
+        """Push buffered error entries to the dashboard cache."""
+        with self._cache_buffer_lock:
+            buffered, self._cache_buffer = self._cache_buffer, defaultdict(list)
+            self._cache_last_flush = time.monotonic()
+
+        client = self._get_redis()
+
+        for cache_key, entries in buffered.items():
+            # Prefer Redis RPUSH + EXPIRE: an atomic append that is O(batch)
+            # rather than reserializing the whole hour bucket, and two
+            # concurrent workers can't lose each other's entries
+            if client is not None:
+                try:
+                    pipe = client.pipeline()
+                    pipe.rpush(cache_key, *[json.dumps(e, default=str) for e in entries])
+                    pipe.expire(cache_key, 3600)  # 1 hour TTL
+                    pipe.execute()
+                    continue
+                except Exception as e:
+                    logger.warning("Redis error-log append failed, using cache fallback: %s", e)
+                    self._redis = False
+                    client = None
+
+            try:
+                existing_errors = cache.get(cache_key, [])
+                existing_errors.extend(entries)
+                cache.set(cache_key, existing_errors, 3600)  # 1 hour TTL
+            except Exception as e:
+                logger.warning("Failed to cache errors: %s", e)
 
     def _determine_recovery_strategy(
         self,
@@ -233,11 +511,15 @@ class ErrorHandlingService:
         severity: ErrorSeverity
     ) -> RecoveryStrategy:
         """Determine appropriate recovery strategy for an error."""
-        error_type = type(error).__name__
+        # Class-keyed lookup first: no __name__ string build, and subclasses
+        # inherit their base class's strategy
+        for error_cls, strategy in _STRATEGY_BY_CLASS:
+            if isinstance(error, error_cls):
+                return strategy
 
-        # Check if we have a specific strategy for this error type
-        if error_type in self.recovery_strategies:
-            return self.recovery_strategies[error_type]
+        strategy = self.recovery_strategies.get(type(error).__name__)
+        if strategy is not None:
+            return strategy
 
         # Default strategy based on severity
         if severity == ErrorSeverity.CRITICAL:
@@ -255,7 +537,7 @@ class ErrorHandlingService:
         context: ErrorContext
     ):
         """Apply recovery strategy for an error."""
-        logger.info(f"Applying recovery strategy '{strategy.value}' for {context.component}.{context.operation}")
+        logger.info("Applying recovery strategy '%s' for %s.%s", strategy.value, context.component, context.operation)
 
         if strategy == RecoveryStrategy.RETRY:
             # Will be handled by retry decorator
@@ -263,23 +545,23 @@ class ErrorHandlingService:
 
         elif strategy == RecoveryStrategy.FALLBACK:
             # Use fallback mechanism
-            logger.info(f"Using fallback mechanism for {context.operation}")
+            logger.info("Using fallback mechanism for %s", context.operation)
 
         elif strategy == RecoveryStrategy.GRACEFUL_DEGRADATION:
             # Reduce functionality but continue
-            logger.info(f"Gracefully degrading functionality for {context.operation}")
+            logger.info("Gracefully degrading functionality for %s", context.operation)
 
         elif strategy == RecoveryStrategy.SKIP_AND_CONTINUE:
             # Skip this operation and continue
-            logger.info(f"Skipping operation {context.operation} and continuing")
+            logger.info("Skipping operation %s and continuing", context.operation)
 
         elif strategy == RecoveryStrategy.ABORT:
             # Abort the entire workflow
-            logger.error(f"Aborting workflow due to critical error in {context.operation}")
+            logger.error("Aborting workflow due to critical error in %s", context.operation)
 
         elif strategy == RecoveryStrategy.ESCALATE:
             # Escalate to human intervention
-            logger.error(f"Escalating error in {context.operation} for human intervention")
+            logger.error("Escalating error in %s for human intervention", context.operation)
             self._escalate_error(context)
 
     def _escalate_error(self, context: ErrorContext):
@@ -290,13 +572,15 @@ class ErrorHandlingService:
         # - PagerDuty
         # - etc.
 
-        logger.critical(f"ERROR ESCALATION: {context.component}.{context.operation}")
-        logger.critical(f"Details: {context.to_dict()}")
+        logger.critical("ERROR ESCALATION: %s.%s", context.component, context.operation)
+        logger.critical("Details: %s", context.to_dict())
 
-        # Store in database for admin dashboard
+        # Queue for the background writer instead of a synchronous one-INSERT
+        # transaction per escalation; under an incident storm the DB sees
+        # one bulk_create per batch and the caller never blocks
         try:
             from common.models import ErrorLog
-            ErrorLog.objects.create(
+            record = ErrorLog(
                 component=context.component,
                 operation=context.operation,
                 error_type=type(context.error).__name__,
@@ -306,7 +590,49 @@ class ErrorHandlingService:
                 metadata=context.metadata
             )
         except Exception as e:
-            logger.error(f"Failed to store error log: {e}")
+            logger.error("Failed to build error log record: %s", e)
+            return
+
+        self._ensure_escalation_writer()
+        try:
+            self._escalation_queue.put_nowait(record)
+        except queue.Full:
+            # Bounded memory beats completeness during a storm
+            logger.error("Escalation queue full; dropping escalated error")
+
+    def _ensure_escalation_writer(self):
+        """Start the daemon writer thread on first escalation."""
+        if self._escalation_thread is not None:
+            return
+        with self._escalation_thread_lock:
+            if self._escalation_thread is None:
+                self._escalation_thread = threading.Thread(
+                    target=self._escalation_writer,
+                    name="error-escalation-writer",
+                    daemon=True
+                )
+                self._escalation_thread.start()
+
+    def _escalation_writer(self):
+        """Drain escalated errors and persist them in bulk batches."""
+        from common.models import ErrorLog
+
+        while True:
+            batch = [self._escalation_queue.get()]
+            deadline = time.monotonic() + 1.0
+            while len(batch) < self.ESCALATION_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._escalation_queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            try:
+                ErrorLog.objects.bulk_create(batch, ignore_conflicts=True)
+            except Exception as e:
+                logger.error("Failed to store %s escalated errors: %s", len(batch), e)
 
     def get_circuit_breaker(
         self,
@@ -314,55 +640,158 @@ class ErrorHandlingService:
         failure_threshold: int = 5,
         recovery_timeout: int = 60
     ) -> CircuitBreaker:
-        """Get or create a circuit breaker for a component."""
-        if name not in self.circuit_breakers:
-            self.circuit_breakers[name] = CircuitBreaker(
+        """Get or create a circuit breaker for a component.
+
+        Callers on hot paths should resolve their breaker once and keep the
+        reference (as the handle_errors decorator does) rather than paying a
+        key build and registry lookup per call.
+        """
+        breaker = self.circuit_breakers.get(name)
+        if breaker is None:
+            # setdefault so two threads racing on first use share one breaker
+            breaker = self.circuit_breakers.setdefault(name, CircuitBreaker(
                 failure_threshold=failure_threshold,
                 recovery_timeout=recovery_timeout
-            )
-
-        return self.circuit_breakers[name]
+            ))
+
+        return breaker
+
+    def _intern(self, ids: Dict[str, int], names: List[str], key: str) -> int:
+        """Map a small string to a stable int code, assigning on first use."""
+        code = ids.get(key)
+        if code is None:
+            # Assignment races are rare (only on first sighting of a name);
+            # the shards lock keeps (ids, names) consistent
+            with self._shards_lock:
+                code = ids.get(key)
+                if code is None:
+                    code = len(names)
+                    names.append(key)
+                    ids[key] = code
+        return code
+
+    def _get_shard(self) -> _LogShard:
+        """Get this thread's log shard, registering it on first use."""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _LogShard(self.ERROR_LOG_MAXLEN)
+            self._local.shard = shard
+            with self._shards_lock:
+                self._log_shards.append(shard)
+        return shard
+
+    @property
+    def error_log(self) -> List[ErrorContext]:
+        """All buffered errors merged across thread shards, oldest first."""
+        with self._shards_lock:
+            shards = list(self._log_shards)
+
+        def _snapshot(shard):
+            with shard.lock:
+                return list(shard.contexts)
+
+        merged = list(heapq.merge(
+            *(_snapshot(shard) for shard in shards),
+            key=lambda c: c.timestamp_epoch
+        ))
+        return merged[-self.ERROR_LOG_MAXLEN:]
+
+    def _recent_contexts(self, hours: int) -> List[ErrorContext]:
+        """Get ErrorContexts from the last N hours, oldest first."""
+        cutoff_epoch = (datetime.now() - timedelta(hours=hours)).timestamp()
+
+        with self._shards_lock:
+            shards = list(self._log_shards)
+
+        # Each shard's timestamps are appended in monotonically increasing
+        # order, so the window boundary is found by binary search per shard
+        # (no per-entry Python comparison), then the sorted tails are merged
+        parts = []
+        for shard in shards:
+            with shard.lock:
+                timestamps = list(shard.timestamps)
+                start = bisect_left(timestamps, cutoff_epoch)
+                if start < len(timestamps):
+                    parts.append(list(islice(shard.contexts, start, None)))
+
+        if not parts:
+            return []
+        if len(parts) == 1:
+            return parts[0]
+        return list(heapq.merge(*parts, key=lambda c: c.timestamp_epoch))
 
     def get_recent_errors(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get recent errors from the last N hours."""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-
-        recent_errors = [
-            error for error in self.error_log
-            if datetime.fromisoformat(error['timestamp']) >= cutoff_time
-        ]
-
-        return recent_errors
+        return [context.to_dict() for context in self._recent_contexts(hours)]
 
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics for monitoring."""
-        recent_errors = self.get_recent_errors(24)
+        cutoff_epoch = (datetime.now() - timedelta(hours=24)).timestamp()
+
+        with self._shards_lock:
+            shards = list(self._log_shards)
+            component_names = list(self._component_names)
+            type_names = list(self._type_names)
+
+        # Aggregate over the columnar int codes: per shard, binary-search
+        # the 24h window boundary, then np.bincount counts the tail in C.
+        # No context objects, attribute lookups or per-entry dict updates
+        # are touched, so this stays flat as the buffers grow.
+        total = 0
+        severity_counts = np.zeros(len(_SEVERITY_ORDER), dtype=np.int64)
+        component_counts = np.zeros(len(component_names), dtype=np.int64)
+        type_counts = np.zeros(len(type_names), dtype=np.int64)
+
+        for shard in shards:
+            with shard.lock:
+                timestamps = list(shard.timestamps)
+                start = bisect_left(timestamps, cutoff_epoch)
+                count = len(timestamps) - start
+                if count <= 0:
+                    continue
+                severity_tail = np.fromiter(
+                    islice(shard.severity_codes, start, None),
+                    dtype=np.int64, count=count)
+                component_tail = np.fromiter(
+                    islice(shard.component_codes, start, None),
+                    dtype=np.int64, count=count)
+                type_tail = np.fromiter(
+                    islice(shard.type_codes, start, None),
+                    dtype=np.int64, count=count)
+            total += count
+            severity_counts += np.bincount(
+                severity_tail, minlength=len(severity_counts))
+            component_counts += np.bincount(
+                component_tail, minlength=len(component_counts))
+            type_counts += np.bincount(
+                type_tail, minlength=len(type_counts))
 
         stats = {
-            'total_errors_24h': len(recent_errors),
-            'errors_by_severity': {},
-            'errors_by_component': {},
-            'errors_by_type': {},
+            'total_errors_24h': total,
+            'errors_by_severity': {
+                severity.value: int(count)
+                for severity, count in zip(_SEVERITY_ORDER, severity_counts)
+                if count
+            },
+            'errors_by_component': {
+                name: int(count)
+                for name, count in zip(component_names, component_counts)
+                if count
+            },
+            'errors_by_type': {
+                name: int(count)
+                for name, count in zip(type_names, type_counts)
+                if count
+            },
             'circuit_breaker_states': {}
         }
 
-        # Count by severity
-        for error in recent_errors:
-            severity = error.get('severity', 'unknown')
-            stats['errors_by_severity'][severity] = stats['errors_by_severity'].get(severity, 0) + 1
-
-            component = error.get('component', 'unknown')
-            stats['errors_by_component'][component] = stats['errors_by_component'].get(component, 0) + 1
-
-            error_type = error.get('error_type', 'unknown')
-            stats['errors_by_type'][error_type] = stats['errors_by_type'].get(error_type, 0) + 1
-
         # Get circuit breaker states
         for name, breaker in self.circuit_breakers.items():
             stats['circuit_breaker_states'][name] = {
                 'state': breaker.state,
                 'failure_count': breaker.failure_count,
-                'last_failure': breaker.last_failure_time.isoformat() if breaker.last_failure_time else None
+                'last_failure': breaker.opened_at.isoformat() if breaker.opened_at else None
             }
 
         return stats
@@ -372,6 +801,26 @@ class ErrorHandlingService:
 error_service = ErrorHandlingService()
 
 
+def _capture(e, func, args, kwargs, operation, component, severity):
+    """Record a wrapped-function failure with the error service.
+
+    Shared by both handle_errors wrappers so the metadata-building block
+    exists once: the wrappers' except clauses stay two bytecodes instead of
+    two copies of the same dict construction.
+    """
+    error_service.handle_error(
+        error=e,
+        operation=operation,
+        component=component,
+        severity=severity,
+        metadata={
+            'function': func.__name__,
+            'args': str(args)[:200],
+            'kwargs': str(kwargs)[:200]
+        }
+    )
+
+
 # Decorator for automatic error handling
 def handle_errors(
     operation: str,
@@ -388,54 +837,35 @@ def handle_errors(
             ...
     """
     def decorator(func: Callable):
+        # Resolve the breaker once at decoration time instead of paying an
+        # f-string build plus a registry lookup on every call
+        breaker = error_service.get_circuit_breaker(f"{component}:{operation}") if use_circuit_breaker else None
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             try:
-                if use_circuit_breaker:
-                    breaker = error_service.get_circuit_breaker(f"{component}:{operation}")
-                    return await breaker.call(func, *args, **kwargs)
+                if breaker is not None:
+                    return await breaker.acall(func, *args, **kwargs)
                 else:
                     return await func(*args, **kwargs)
 
             except Exception as e:
-                error_service.handle_error(
-                    error=e,
-                    operation=operation,
-                    component=component,
-                    severity=severity,
-                    metadata={
-                        'function': func.__name__,
-                        'args': str(args)[:200],
-                        'kwargs': str(kwargs)[:200]
-                    }
-                )
+                _capture(e, func, args, kwargs, operation, component, severity)
                 raise
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             try:
-                if use_circuit_breaker:
-                    breaker = error_service.get_circuit_breaker(f"{component}:{operation}")
+                if breaker is not None:
                     return breaker.call(func, *args, **kwargs)
                 else:
                     return func(*args, **kwargs)
 
             except Exception as e:
-                error_service.handle_error(
-                    error=e,
-                    operation=operation,
-                    component=component,
-                    severity=severity,
-                    metadata={
-                        'function': func.__name__,
-                        'args': str(args)[:200],
-                        'kwargs': str(kwargs)[:200]
-                    }
-                )
+                _capture(e, func, args, kwargs, operation, component, severity)
                 raise
 
         # Return appropriate wrapper based on function type
-        import asyncio
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         else:
@@ -455,7 +885,7 @@ class FallbackManager:
     def register_fallback(self, operation: str, fallback_func: Callable):
         """Register a fallback function for an operation."""
         self.fallback_functions[operation] = fallback_func
-        logger.info(f"Registered fallback for operation: {operation}")
+        logger.info("Registered fallback for operation: %s", operation)
 
     def execute_with_fallback(
         self,
@@ -468,14 +898,14 @@ class FallbackManager:
         try:
             return primary_func(*args, **kwargs)
         except Exception as e:
-            logger.warning(f"Primary function failed for {operation}: {e}")
+            logger.warning("Primary function failed for %s: %s", operation, e)
 
             if operation in self.fallback_functions:
-                logger.info(f"Executing fallback for {operation}")
+                logger.info("Executing fallback for %s", operation)
                 try:
                     return self.fallback_functions[operation](*args, **kwargs)
                 except Exception as fallback_error:
-                    logger.error(f"Fallback also failed for {operation}: {fallback_error}")
+                    logger.error("Fallback also failed for %s: %s", operation, fallback_error)
                     raise
 
             raise
@@ -6,17 +6,31 @@ for the LangGraph workflow using LangSmith, replacing custom logging
 with standardized run logs and compliance tracking.
 """
 
+import atexit
+import hashlib
 import os
 import logging
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from itertools import islice
 from typing import Dict, List, Any, Optional, Callable
-from datetime import datetime
-from functools import wraps
-import json
+from datetime import datetime, timezone
+import random
+from functools import lru_cache, wraps
+
+import orjson
 
 from langsmith import Client
 from langsmith.run_helpers import traceable
 from langchain_core.tracers import LangChainTracer
-from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.callbacks import AsyncCallbackHandler
 from langchain_core.messages import BaseMessage
 
 from .state import EchoChamberAnalystState, TaskStatus
@@ -24,6 +38,88 @@ from .state import EchoChamberAnalystState, TaskStatus
 logger = logging.getLogger(__name__)
 
 
+# Pre-bound so hot audit appends skip the module attribute lookup
+_now_ns = time.time_ns
+
+# Active workflow run id, task-local so nodes pick it up without the
+# orchestrator having to mutate the state object
+_run_id_var: ContextVar[Optional[str]] = ContextVar("monitoring_run_id", default=None)
+
+
+def _format_ts(ns: int) -> str:
+    """Format a nanosecond epoch timestamp as ISO-8601 (export time only)."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+# Slotted event types for the hottest audit paths - roughly 4x smaller than
+# the equivalent dict and cheaper to construct. Variable-payload events
+# (compliance events, RAG tracking) stay plain dicts.
+
+@dataclass(slots=True, frozen=True)
+class PIIEvent:
+    ts_ns: int
+    content_id: str
+    pii_type: str
+    action: str
+    event_type: str = "pii_detection"
+    compliance_level: str = "GDPR"
+
+
+@dataclass(slots=True, frozen=True)
+class FilterEvent:
+    ts_ns: int
+    content_id: str
+    filter_reason: str
+    toxicity_score: float
+    event_type: str = "content_filtering"
+    compliance_level: str = "Content_Safety"
+
+
+@dataclass(slots=True, frozen=True)
+class AIDecisionEvent:
+    ts_ns: int
+    decision_type: str
+    criteria: Dict[str, Any]
+    outcome: str
+    event_type: str = "ai_decision"
+    compliance_level: str = "AI_Governance"
+
+
+@dataclass(slots=True, frozen=True)
+class ErrorEvent:
+    ts_ns: int
+    run_id: str
+    error: str
+    event_type: str = "workflow_error"
+    compliance_level: str = "Error_Tracking"
+
+
+def _event_dict(event: Any) -> Dict[str, Any]:
+    """Normalize an audit event (dict or slotted dataclass) to a dict."""
+    return event if isinstance(event, dict) else asdict(event)
+
+
+def _format_event(event: Any) -> Dict[str, Any]:
+    """Return a copy of an audit event with ``ts_ns`` rendered as ``timestamp``."""
+    event = _event_dict(event)
+    if "ts_ns" not in event:
+        return event
+    return {
+        "timestamp": _format_ts(event["ts_ns"]),
+        **{k: v for k, v in event.items() if k != "ts_ns"}
+    }
+
+
+def _query_preview(query: str, max_chars: int) -> str:
+    """Cap a query for audit storage without copying when already short.
+
+    Short previews are interned - chatbot traffic repeats many small
+    queries, and interning lets retained audit events share one string.
+    """
+    preview = query if len(query) <= max_chars else query[:max_chars]
+    return sys.intern(preview) if len(preview) < 64 else preview
+
+
 def get_state_value(state: Any, key: str, default: Any = None):
     """Safely get value from state whether it's dict or object."""
     if isinstance(state, dict):
@@ -33,51 +129,193 @@ def get_state_value(state: Any, key: str, default: Any = None):
 
 
 class ComplianceTracker:
-    """Track compliance violations and audit requirements."""
+    """Track compliance violations and audit requirements.
 
-    def __init__(self):
+    The in-memory log is a bounded ring buffer; a background thread spills
+    the older half into a small SQLite store (WAL mode) so long-running
+    workers keep a flat memory footprint without losing audit history.
+    """
+
+    MAX_EVENTS = 10_000
+    SPILL_INTERVAL_SECONDS = 5.0
+
+    def __init__(self, db_path: Optional[str] = None):
         self.violations = []
-        self.audit_events = []
+        self.audit_events = deque(maxlen=self.MAX_EVENTS)
+        # Per-type buckets maintained at insert so report generation never
+        # has to scan the full audit log
+        self._by_type = defaultdict(lambda: deque(maxlen=self.MAX_EVENTS))
+        self._lock = threading.Lock()
+        self._db_path = db_path or os.getenv("COMPLIANCE_AUDIT_DB", "compliance_audit.db")
+        self._sink = None
+        # Background threads are started lazily on first enqueue, not here:
+        # the tracker is constructed at import time via global_monitor, and
+        # daemon threads started before a Celery prefork fork do not survive
+        # into the worker processes
+        self._threads_lock = threading.Lock()
+        self._spill_thread = None
+        # Queue for events submitted from failing coroutines/threads; a
+        # consumer thread drains into the ring buffer so the submitter
+        # never waits on the audit lock
+        self._async_queue: queue.Queue = queue.Queue(maxsize=1000)
+        self._overflow_logged = False
+        self._async_consumer = None
+
+    def _ensure_spill_thread(self):
+        """Start the spill thread in the process that first logs an event.
+
+        ``is_alive`` is False for a Thread object inherited across a fork,
+        so a worker that inherited the parent's dead thread restarts it.
+        """
+        thread = self._spill_thread
+        if thread is not None and thread.is_alive():
+            return
+        with self._threads_lock:
+            thread = self._spill_thread
+            if thread is None or not thread.is_alive():
+                self._spill_thread = threading.Thread(
+                    target=self._spill_loop, name="compliance-audit-spill", daemon=True
+                )
+                self._spill_thread.start()
+
+    def _ensure_async_consumer(self):
+        """Start the async-queue consumer in the process that first submits."""
+        thread = self._async_consumer
+        if thread is not None and thread.is_alive():
+            return
+        with self._threads_lock:
+            thread = self._async_consumer
+            if thread is None or not thread.is_alive():
+                self._async_consumer = threading.Thread(
+                    target=self._drain_async, name="compliance-audit-consumer", daemon=True
+                )
+                self._async_consumer.start()
+
+    def add_event(self, event: Any):
+        """Append an audit event (dict or slotted event type), keeping the
+        per-type index in sync."""
+        self._ensure_spill_thread()
+        event_type = event.get("event_type") if isinstance(event, dict) else event.event_type
+        with self._lock:
+            self.audit_events.append(event)
+            self._by_type[event_type].append(event)
+
+    def submit_async(self, event: Any):
+        """Enqueue an audit event without blocking the caller.
+
+        Meant for error paths where the submitting coroutine should never
+        wait; drops the event (logging the overflow once) when the queue
+        is full.
+        """
+        self._ensure_async_consumer()
+        try:
+            self._async_queue.put_nowait(event)
+        except queue.Full:
+            if not self._overflow_logged:
+                self._overflow_logged = True
+                logger.warning("Audit event queue full; dropping events")
+
+    def _drain_async(self):
+        while True:
+            self.add_event(self._async_queue.get())
+
+    def events_of_type(self, event_type: str) -> List[Dict[str, Any]]:
+        """Return recent audit events of the given type without scanning."""
+        with self._lock:
+            return list(self._by_type.get(event_type, ()))
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """Return the most recent ``n`` in-memory audit events."""
+        with self._lock:
+            if n >= len(self.audit_events):
+                return list(self.audit_events)
+            return list(islice(self.audit_events, len(self.audit_events) - n, None))
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return a copy of the in-memory audit log."""
+        with self._lock:
+            return list(self.audit_events)
+
+    def _ensure_sink(self) -> sqlite3.Connection:
+        if self._sink is None:
+            self._sink = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._sink.execute("PRAGMA journal_mode=WAL")
+            self._sink.execute("PRAGMA synchronous=NORMAL")
+            self._sink.execute(
+                "CREATE TABLE IF NOT EXISTS events (ts_ns INTEGER, event_type TEXT, payload_json TEXT)"
+            )
+        return self._sink
+
+    def _spill_loop(self):
+        while True:
+            time.sleep(self.SPILL_INTERVAL_SECONDS)
+            try:
+                self._spill()
+            except Exception as e:
+                logger.error("Audit spill to SQLite failed: %s", e)
+
+    def _spill(self):
+        """Move the older half of the ring buffer into the SQLite sink."""
+        threshold = self.MAX_EVENTS // 2
+        with self._lock:
+            if len(self.audit_events) <= threshold:
+                return
+            drained = [
+                self.audit_events.popleft()
+                for _ in range(len(self.audit_events) - threshold)
+            ]
+        sink = self._ensure_sink()
+        sink.executemany(
+            "INSERT INTO events (ts_ns, event_type, payload_json) VALUES (?, ?, ?)",
+            [
+                (d.get("ts_ns", 0), d.get("event_type", ""), orjson.dumps(d, default=str).decode())
+                for d in map(_event_dict, drained)
+            ]
+        )
+        sink.commit()
+
+    def spilled_events(self) -> List[Dict[str, Any]]:
+        """Load events previously spilled to SQLite, oldest first."""
+        if self._sink is None and not os.path.exists(self._db_path):
+            return []
+        rows = self._ensure_sink().execute(
+            "SELECT payload_json FROM events ORDER BY ts_ns"
+        ).fetchall()
+        return [orjson.loads(row[0]) for row in rows]
 
     def log_pii_detection(self, content_id: str, pii_type: str, action: str):
         """Log PII detection and handling for compliance."""
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": "pii_detection",
-            "content_id": content_id,
-            "pii_type": pii_type,
-            "action": action,
-            "compliance_level": "GDPR"
-        }
-        self.audit_events.append(event)
+        self.add_event(PIIEvent(_now_ns(), content_id, pii_type, action))
 
     def log_content_filtering(self, content_id: str, filter_reason: str, toxicity_score: float):
         """Log content filtering decisions."""
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": "content_filtering",
-            "content_id": content_id,
-            "filter_reason": filter_reason,
-            "toxicity_score": toxicity_score,
-            "compliance_level": "Content_Safety"
-        }
-        self.audit_events.append(event)
+        self.add_event(FilterEvent(_now_ns(), content_id, filter_reason, toxicity_score))
 
     def log_ai_decision(self, decision_type: str, criteria: Dict[str, Any], outcome: str):
         """Log AI decision making for explainability."""
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": "ai_decision",
-            "decision_type": decision_type,
-            "criteria": criteria,
-            "outcome": outcome,
-            "compliance_level": "AI_Governance"
-        }
-        self.audit_events.append(event)
+        self.add_event(AIDecisionEvent(_now_ns(), decision_type, criteria, outcome))
+
 
+# (prompt, completion) price per token, keyed by model name
+MODEL_PRICES = {
+    "gpt-4": (3e-05, 6e-05),
+    "gpt-4o": (2.5e-06, 1e-05),
+    "gpt-4o-mini": (1.5e-07, 6e-07),
+    "o3-mini": (1.1e-06, 4.4e-06),
+    "text-embedding-3-small": (2e-08, 0.0),
+}
+# Fall back to GPT-4 pricing (the previous hard-coded assumption)
+DEFAULT_MODEL_PRICE = MODEL_PRICES["gpt-4"]
 
-class EchoChamberCallbackHandler(BaseCallbackHandler):
-    """Custom callback handler for EchoChamber-specific monitoring."""
+TokenUsage = namedtuple("TokenUsage", ["prompt", "completion", "total"])
+RunCost = namedtuple("RunCost", ["prompt", "completion", "total"])
+
+
+class EchoChamberCallbackHandler(AsyncCallbackHandler):
+    """Custom async callback handler for EchoChamber-specific monitoring.
+
+    Async so callback bookkeeping never blocks the LangGraph event loop.
+    """
 
     def __init__(self, compliance_tracker: ComplianceTracker):
         super().__init__()
@@ -85,39 +323,40 @@ class EchoChamberCallbackHandler(BaseCallbackHandler):
         self.run_costs = {}
         self.run_tokens = {}
 
-    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs) -> None:
+    async def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs) -> None:
         """Track LLM call start."""
         run_id = kwargs.get("run_id")
         if run_id:
-            logger.debug(f"LLM call started: {run_id}")
+            logger.debug("LLM call started: %s", run_id)
 
-    def on_llm_end(self, response, **kwargs) -> None:
+    async def on_llm_end(self, response, **kwargs) -> None:
         """Track LLM call completion and costs."""
         run_id = kwargs.get("run_id")
         if run_id and hasattr(response, 'llm_output'):
             llm_output = response.llm_output or {}
             token_usage = llm_output.get('token_usage', {})
 
-            self.run_tokens[str(run_id)] = {
-                "prompt_tokens": token_usage.get('prompt_tokens', 0),
-                "completion_tokens": token_usage.get('completion_tokens', 0),
-                "total_tokens": token_usage.get('total_tokens', 0)
-            }
+            prompt_tokens = token_usage.get('prompt_tokens', 0)
+            completion_tokens = token_usage.get('completion_tokens', 0)
+            self.run_tokens[run_id] = TokenUsage(
+                prompt_tokens,
+                completion_tokens,
+                token_usage.get('total_tokens', 0)
+            )
 
-            # Estimate costs (GPT-4 pricing)
-            prompt_cost = token_usage.get('prompt_tokens', 0) * 0.00003
-            completion_cost = token_usage.get('completion_tokens', 0) * 0.00006
+            # Data-driven pricing keyed by model name
+            p_in, p_out = MODEL_PRICES.get(
+                llm_output.get('model_name'), DEFAULT_MODEL_PRICE
+            )
+            prompt_cost = prompt_tokens * p_in
+            completion_cost = completion_tokens * p_out
             total_cost = prompt_cost + completion_cost
+            self.run_costs[run_id] = RunCost(prompt_cost, completion_cost, total_cost)
 
-            self.run_costs[str(run_id)] = {
-                "prompt_cost": prompt_cost,
-                "completion_cost": completion_cost,
-                "total_cost": total_cost
-            }
-
-            logger.info(f"LLM call completed: {run_id}, tokens: {token_usage}, cost: ${total_cost:.6f}")
+            logger.info("LLM call completed: %s, tokens: %s, cost: $%.6f",
+                        run_id, token_usage, total_cost)
 
-    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs) -> None:
+    async def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs) -> None:
         """Track tool usage for compliance."""
         tool_name = serialized.get("name", "unknown")
         run_id = kwargs.get("run_id")
@@ -130,27 +369,140 @@ class EchoChamberCallbackHandler(BaseCallbackHandler):
                 outcome="tool_executed"
             )
 
-    def on_chain_error(self, error: Exception, **kwargs) -> None:
+    async def on_chain_error(self, error: BaseException, **kwargs) -> None:
         """Track errors for debugging and compliance."""
         run_id = kwargs.get("run_id")
-        logger.error(f"Chain error in run {run_id}: {error}")
+        logger.error("Chain error in run %s: %s", run_id, error)
+
+        self.compliance_tracker.submit_async(ErrorEvent(_now_ns(), str(run_id), str(error)))
+
+
+@lru_cache(maxsize=16)
+def _get_client(api_url: str, api_key: str) -> Client:
+    """Return a process-wide Client for this (api_url, api_key) config.
+
+    Each Client owns an HTTP connection pool; caching by config means
+    repeated monitor setups (e.g. per gunicorn worker reload) share one
+    pool instead of building a fresh session each time.
+    """
+    return Client(api_url=api_url, api_key=api_key, timeout_ms=120_000)
+
+
+atexit.register(_get_client.cache_clear)
 
-        self.compliance_tracker.audit_events.append({
-            "timestamp": datetime.now().isoformat(),
-            "event_type": "workflow_error",
-            "run_id": str(run_id),
-            "error": str(error),
-            "compliance_level": "Error_Tracking"
-        })
+
+def _dotted_segment(run_id: uuid.UUID, start_time: datetime) -> str:
+    """Build the dotted-order segment LangSmith expects for batched runs."""
+    return start_time.strftime("%Y%m%dT%H%M%S%fZ") + str(run_id)
+
+
+class _RunUploader:
+    """Batch LangSmith run uploads off the hot path.
+
+    Producers enqueue run dicts with a single ``queue.put``; a daemon thread
+    drains the queue and POSTs batches via ``Client.batch_ingest_runs``,
+    replacing one HTTPS round trip per create/update with amortized batch
+    uploads.
+    """
+
+    MAX_QUEUE_SIZE = 1000
+    MAX_BATCH_RUNS = 100
+    FLUSH_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, client: Client):
+        self.client = client
+        self._queue: queue.Queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        # The drain thread is started lazily on first submit: the uploader
+        # is built at import time, and a daemon thread started before a
+        # Celery prefork fork would not exist in the worker processes
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _ensure_thread(self):
+        """Start the drain thread in the process that first submits a run.
+
+        ``is_alive`` is False for a Thread object inherited across a fork,
+        so a worker that inherited the parent's dead thread restarts it.
+        """
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            return
+        with self._thread_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="langsmith-run-uploader", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, kind: str, payload: Dict[str, Any]):
+        """Enqueue a run payload; ``kind`` is 'create' or 'update'.
+
+        Drops the event rather than blocking the caller when the queue is
+        full - monitoring must never stall the workflow.
+        """
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((kind, payload))
+        except queue.Full:
+            logger.debug("Run upload queue full; dropping %s event", kind)
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.FLUSH_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+            self._flush_batch(first)
+
+    def _flush_batch(self, first):
+        batch = [first]
+        while len(batch) < self.MAX_BATCH_RUNS:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        creates = [payload for kind, payload in batch if kind == "create"]
+        updates = [payload for kind, payload in batch if kind == "update"]
+        try:
+            self.client.batch_ingest_runs(create=creates, update=updates)
+        except Exception as e:
+            logger.error("Failed to batch-upload %d runs: %s", len(batch), e)
+
+    def flush(self):
+        """Drain any queued runs synchronously (registered atexit)."""
+        try:
+            first = self._queue.get_nowait()
+        except queue.Empty:
+            return
+        self._flush_batch(first)
+        self.flush()
 
 
 class LangSmithMonitor:
     """Main monitoring class integrating LangSmith with EchoChamber workflows."""
 
+    # Upper bound on remembered root-run dotted orders (concurrent workflows)
+    TRACE_ORDER_MAX_ENTRIES = 1024
+
     def __init__(self):
         self.client = None
+        self._uploader = None
+        # Root-run dotted orders for in-flight workflows, LRU-bounded: a
+        # long-lived process creates runs indefinitely and nothing tells us
+        # when a root run is finished, so stale entries are evicted oldest
+        # first once the map outgrows TRACE_ORDER_MAX_ENTRIES
+        self._trace_orders: "OrderedDict[str, str]" = OrderedDict()
         self.compliance_tracker = ComplianceTracker()
         self.callback_handler = EchoChamberCallbackHandler(self.compliance_tracker)
+        self._project = "echochamber-analyst"
+        self._endpoint = "https://api.smith.langchain.com"
+        self._sample_rate = 1.0
+        self._tracer: Optional[LangChainTracer] = None
+        # Recently audited RAG queries (blake2b digest -> expiry), see
+        # _is_duplicate_rag_query
+        self._rag_dedup: "OrderedDict[bytes, float]" = OrderedDict()
         self._setup_langsmith()
 
     def _setup_langsmith(self):
@@ -158,14 +510,15 @@ class LangSmithMonitor:
         try:
             # Check for LangSmith configuration
             langsmith_api_key = os.getenv("LANGSMITH_API_KEY")
-            langsmith_project = os.getenv("LANGSMITH_PROJECT", "echochamber-analyst")
-            langsmith_endpoint = os.getenv("LANGSMITH_ENDPOINT", "https://api.smith.langchain.com")
+            # Bind env config once; runtime paths use the attributes
+            self._project = langsmith_project = os.getenv("LANGSMITH_PROJECT", self._project)
+            self._endpoint = langsmith_endpoint = os.getenv("LANGSMITH_ENDPOINT", self._endpoint)
+            self._sample_rate = float(os.getenv("LANGSMITH_SAMPLING_RATE", "1.0"))
 
             if langsmith_api_key:
-                self.client = Client(
-                    api_url=langsmith_endpoint,
-                    api_key=langsmith_api_key
-                )
+                self.client = _get_client(langsmith_endpoint, langsmith_api_key)
+                # Background uploader batches run writes off the hot path
+                self._uploader = _RunUploader(self.client)
 
                 # Set environment variables for LangChain integration
                 os.environ["LANGCHAIN_TRACING_V2"] = "true"
@@ -173,61 +526,88 @@ class LangSmithMonitor:
                 os.environ["LANGCHAIN_ENDPOINT"] = langsmith_endpoint
                 os.environ["LANGCHAIN_API_KEY"] = langsmith_api_key
 
-                # Test the connection
-                try:
-                    # Try to create a simple test run to verify connection
-                    test_run = self.client.create_run(
-                        name="echochamber_connection_test",
-                        run_type="chain",
-                        inputs={"test": "connection"},
-                        project_name=langsmith_project
-                    )
-                    self.client.update_run(test_run.id, outputs={"status": "connected"})
-                    logger.info(f"✅ LangSmith monitoring successfully initialized for project: {langsmith_project}")
-                    logger.info(f"🔗 LangSmith dashboard: https://smith.langchain.com/")
-                except Exception as test_error:
-                    logger.warning(f"LangSmith client created but connection test failed: {test_error}")
-                    logger.info(f"LangSmith monitoring initialized for project: {langsmith_project}")
+                # Probe the connection off the main thread - startup should
+                # not pay two HTTPS round trips before any real work
+                threading.Thread(
+                    target=self._probe_connection, name="langsmith-probe", daemon=True
+                ).start()
             else:
                 logger.warning("❌ LangSmith API key not found. Monitoring will use local logging only.")
                 logger.warning("   Add LANGSMITH_API_KEY to your .env file to enable full observability")
 
         except Exception as e:
-            logger.error(f"Failed to initialize LangSmith: {e}")
+            logger.error("Failed to initialize LangSmith: %s", e)
+
+    def _probe_connection(self):
+        """Verify LangSmith connectivity with a test run (background thread)."""
+        try:
+            test_run_id = uuid.uuid4()
+            self.client.create_run(
+                name="echochamber_connection_test",
+                run_type="chain",
+                inputs={"test": "connection"},
+                project_name=self._project,
+                id=test_run_id
+            )
+            self.client.update_run(test_run_id, outputs={"status": "connected"})
+            logger.info("✅ LangSmith monitoring successfully initialized for project: %s", self._project)
+            logger.info("🔗 LangSmith dashboard: https://smith.langchain.com/")
+        except Exception as test_error:
+            logger.warning("LangSmith client created but connection test failed: %s", test_error)
+            logger.info("LangSmith monitoring initialized for project: %s", self._project)
 
     def get_tracer(self) -> Optional[LangChainTracer]:
-        """Get LangChain tracer for workflow monitoring."""
-        if self.client:
-            return LangChainTracer()
-        return None
+        """Get LangChain tracer for workflow monitoring.
 
-    def create_workflow_run(self, workflow_id: str, workflow_type: str, campaign_id: str) -> Optional[str]:
-        """Create a top-level run for workflow tracking."""
-        if not self.client:
+        The tracer is created once and reused - it owns an executor and
+        internal queues, so per-workflow construction is wasteful.
+        """
+        if self.client is None:
             return None
+        if self._tracer is None:
+            self._tracer = LangChainTracer()
+        return self._tracer
 
-        try:
-            run = self.client.create_run(
-                name=f"echochamber_workflow_{workflow_type}",
-                run_type="chain",
-                inputs={
-                    "workflow_id": workflow_id,
-                    "workflow_type": workflow_type,
-                    "campaign_id": campaign_id,
-                    "timestamp": datetime.now().isoformat()
-                },
-                project_name=os.getenv("LANGSMITH_PROJECT", "echochamber-analyst"),
-                tags=["echochamber", "workflow", workflow_type]
-            )
-            return str(run.id)
-        except Exception as e:
-            logger.error(f"Failed to create workflow run: {e}")
+    def create_workflow_run(self, workflow_id: str, workflow_type: str, campaign_id: str) -> Optional[str]:
+        """Create a top-level run for workflow tracking.
+
+        The run id is generated locally and returned immediately; the payload
+        is handed to the background uploader so workflow setup never blocks
+        on a LangSmith HTTP round-trip.
+        """
+        if not self._uploader:
+            return None
+        if self._sample_rate < 1.0 and random.random() > self._sample_rate:
             return None
 
-    def log_node_execution(self, run_id: str, node_name: str, state: EchoChamberAnalystState,
-                          inputs: Dict[str, Any], outputs: Dict[str, Any]):
+        run_id = uuid.uuid4()
+        start_time = datetime.now(timezone.utc)
+        dotted_order = _dotted_segment(run_id, start_time)
+        self._trace_orders[str(run_id)] = dotted_order
+        while len(self._trace_orders) > self.TRACE_ORDER_MAX_ENTRIES:
+            self._trace_orders.popitem(last=False)
+        self._uploader.submit("create", {
+            "id": str(run_id),
+            "trace_id": str(run_id),
+            "dotted_order": dotted_order,
+            "name": f"echochamber_workflow_{workflow_type}",
+            "run_type": "chain",
+            "start_time": start_time.isoformat(),
+            "inputs": {
+                "workflow_id": workflow_id,
+                "workflow_type": workflow_type,
+                "campaign_id": campaign_id,
+                "timestamp": start_time.isoformat()
+            },
+            "session_name": self._project,
+            "tags": ["echochamber", "workflow", workflow_type]
+        })
+        return str(run_id)
+
+    async def log_node_execution(self, run_id: str, node_name: str, state: EchoChamberAnalystState,
+                                 inputs: Dict[str, Any], outputs: Dict[str, Any]):
         """Log individual node execution with detailed context."""
-        if not self.client or not run_id:
+        if not self._uploader or not run_id:
             return
 
         try:
@@ -241,14 +621,33 @@ class LangSmithMonitor:
             insights = get_state_value(state, 'insights', [])
             metrics = get_state_value(state, 'metrics')
 
-            node_run = self.client.create_run(
-                name=f"node_{node_name}",
-                run_type="llm" if node_name in ["analyst", "chatbot"] else "tool",
-                inputs=inputs,
-                outputs=outputs,
-                parent_run_id=run_id,
-                tags=["node", node_name, campaign_id],
-                extra={
+            node_run_id = uuid.uuid4()
+            start_time = datetime.now(timezone.utc)
+            parent_order = self._trace_orders.get(str(run_id), "")
+            if parent_order:
+                # Keep active workflows at the fresh end of the LRU
+                self._trace_orders.move_to_end(str(run_id))
+            segment = _dotted_segment(node_run_id, start_time)
+            dotted_order = f"{parent_order}.{segment}" if parent_order else segment
+            last_error = get_state_value(state, 'last_error')
+
+            # The node has already completed by the time we are called, so
+            # one create payload carries outputs, end_time, and error -
+            # no separate update round trip needed
+            self._uploader.submit("create", {
+                "id": str(node_run_id),
+                "trace_id": str(run_id),
+                "dotted_order": dotted_order,
+                "name": f"node_{node_name}",
+                "run_type": "llm" if node_name in ["analyst", "chatbot"] else "tool",
+                "start_time": start_time.isoformat(),
+                "end_time": datetime.now(timezone.utc).isoformat(),
+                "inputs": inputs,
+                "outputs": outputs,
+                "error": last_error,
+                "parent_run_id": str(run_id),
+                "tags": ["node", node_name, campaign_id],
+                "extra": {
                     "node_name": node_name,
                     "workflow_id": workflow_id,
                     "campaign_id": campaign_id,
@@ -260,87 +659,117 @@ class LangSmithMonitor:
                         "total_tokens": metrics.total_tokens_used if metrics and hasattr(metrics, 'total_tokens_used') else 0
                     }
                 }
-            )
-
-            # Update run with completion status
-            self.client.update_run(
-                run_id=node_run.id,
-                status="success" if not state.last_error else "error",
-                error=state.last_error
-            )
+            })
 
         except Exception as e:
-            logger.error(f"Failed to log node execution: {e}")
+            logger.error("Failed to log node execution: %s", e)
 
     def log_compliance_event(self, event_type: str, details: Dict[str, Any]):
         """Log compliance-related events for audit trails."""
-        self.compliance_tracker.audit_events.append({
-            "timestamp": datetime.now().isoformat(),
+        self.compliance_tracker.add_event({
+            "ts_ns": _now_ns(),
             "event_type": event_type,
             "details": details,
             "compliance_level": "Audit_Trail"
         })
 
     def generate_explainability_report(self, workflow_id: str) -> Dict[str, Any]:
-        """Generate explainability report for AI decisions."""
+        """Generate explainability report for AI decisions.
+
+        Timestamps are rendered here, at export time - hot-path appends only
+        store ``ts_ns``.
+        """
+        tracker = self.compliance_tracker
         report = {
             "workflow_id": workflow_id,
             "timestamp": datetime.now().isoformat(),
-            "compliance_events": self.compliance_tracker.audit_events,
+            "compliance_events": [_format_event(e) for e in tracker.snapshot()],
             "ai_decisions": [
-                event for event in self.compliance_tracker.audit_events
-                if event.get("event_type") == "ai_decision"
+                _format_event(e) for e in tracker.events_of_type("ai_decision")
             ],
             "pii_handling": [
-                event for event in self.compliance_tracker.audit_events
-                if event.get("event_type") == "pii_detection"
+                _format_event(e) for e in tracker.events_of_type("pii_detection")
             ],
             "content_filtering": [
-                event for event in self.compliance_tracker.audit_events
-                if event.get("event_type") == "content_filtering"
+                _format_event(e) for e in tracker.events_of_type("content_filtering")
             ]
         }
 
         return report
 
     def export_compliance_data(self, workflow_id: str, format: str = "json") -> str:
-        """Export compliance data for regulatory requirements."""
+        """Export compliance data for regulatory requirements.
+
+        Combines events spilled to the SQLite sink with the in-memory tail.
+        """
         report = self.generate_explainability_report(workflow_id)
+        spilled = self.compliance_tracker.spilled_events()
+        if spilled:
+            report["compliance_events"] = (
+                [_format_event(e) for e in spilled] + report["compliance_events"]
+            )
 
+        # orjson is ~5-10x faster than stdlib json on large reports and
+        # serializes datetimes/UUIDs without a custom encoder
         if format == "json":
-            return json.dumps(report, indent=2)
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str).decode()
         else:
             # Could add CSV, XML formats for different regulatory requirements
-            return json.dumps(report, indent=2)
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str).decode()
 
     # --- Chat / RAG specific helpers (added for chatbot_node compatibility) ---
+    RAG_DEDUP_TTL_SECONDS = 300
+    RAG_DEDUP_MAX_ENTRIES = 1024
+
+    def _is_duplicate_rag_query(self, query: str, campaign_id: Optional[str]) -> bool:
+        """True if this exact query/campaign pair was audited within the TTL.
+
+        Chatbot traffic repeats many queries verbatim; skipping duplicate
+        audit writes cuts event volume without losing information.
+        """
+        key = hashlib.blake2b(
+            f"{campaign_id}:{query}".encode(), digest_size=8
+        ).digest()
+        now = time.monotonic()
+        dup = self._rag_dedup
+        expiry = dup.get(key)
+        if expiry is not None and expiry > now:
+            return True
+        dup[key] = now + self.RAG_DEDUP_TTL_SECONDS
+        dup.move_to_end(key)
+        while len(dup) > self.RAG_DEDUP_MAX_ENTRIES:
+            dup.popitem(last=False)
+        return False
+
     def track_rag_interaction(self, query: str, campaign_id: Optional[str], user_context: Dict[str, Any]):
         """Track a RAG interaction (query received) for observability.
 
         This method is lightweight so it can run even without LangSmith connection.
         """
+        if self._is_duplicate_rag_query(query, campaign_id):
+            return
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": _now_ns(),
             "event_type": "rag_interaction",
-            "query_preview": query[:200],
+            "query_preview": _query_preview(query, 200),
             "campaign_id": campaign_id,
             "user_context": user_context
         }
-        self.compliance_tracker.audit_events.append(event)
-        logger.debug(f"Tracked RAG interaction: {event}")
+        self.compliance_tracker.add_event(event)
+        logger.debug("Tracked RAG interaction: %s", event)
 
     def track_response_quality(self, query: str, response: str, context_sources: int, campaign_context: Optional[str]):
         """Track basic response quality metadata (placeholder for future metrics)."""
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": _now_ns(),
             "event_type": "rag_response",
-            "query_preview": query[:120],
+            "query_preview": _query_preview(query, 120),
             "response_length": len(response or ""),
             "context_sources": context_sources,
             "campaign_id": campaign_context
         }
-        self.compliance_tracker.audit_events.append(event)
-        logger.debug(f"Tracked RAG response quality: {event}")
+        self.compliance_tracker.add_event(event)
+        logger.debug("Tracked RAG response quality: %s", event)
 
 
 # Decorators for monitoring
@@ -350,6 +779,20 @@ def monitor_node_execution(monitor: LangSmithMonitor):
     def decorator(func):
         @wraps(func)
         async def wrapper(state: EchoChamberAnalystState, *args, **kwargs):
+            # No LangSmith client means nothing downstream consumes the
+            # inputs/outputs summaries - skip building them entirely, but
+            # keep the compliance audit trail for node errors
+            if not monitor.client:
+                try:
+                    return await func(state, *args, **kwargs)
+                except Exception as e:
+                    monitor.log_compliance_event("node_error", {
+                        "node_name": func.__name__.replace("_node", ""),
+                        "error": str(e),
+                        "workflow_id": get_state_value(state, 'workflow_id', 'unknown')
+                    })
+                    raise
+
             node_name = func.__name__.replace("_node", "")
 
             # Capture inputs - safely handle dict or object state
@@ -379,9 +822,9 @@ def monitor_node_execution(monitor: LangSmithMonitor):
                 }
 
                 # Log execution
-                monitoring_run_id = get_state_value(state, '_monitoring_run_id')
+                monitoring_run_id = _run_id_var.get()
                 if monitoring_run_id:
-                    monitor.log_node_execution(
+                    await monitor.log_node_execution(
                         monitoring_run_id,
                         node_name,
                         result_state,
@@ -404,28 +847,38 @@ def monitor_node_execution(monitor: LangSmithMonitor):
     return decorator
 
 
-@traceable(name="echochamber_insight_generation")
+# Only install the run-tree tracing wrapper when LangSmith is actually
+# configured; otherwise these stay plain functions with zero call overhead
+_LANGSMITH_ENABLED = bool(os.getenv("LANGSMITH_API_KEY"))
+_traceable = traceable if _LANGSMITH_ENABLED else (lambda **kwargs: (lambda func: func))
+
+
+@_traceable(name="echochamber_insight_generation")
 def trace_insight_generation(content_batch: List[Dict], insights: List[Dict]) -> Dict[str, Any]:
     """Traceable function for insight generation explainability."""
-    return {
+    report = {
         "input_content_count": len(content_batch),
         "generated_insights": len(insights),
         "insight_types": [insight.get("type") for insight in insights],
         "confidence_scores": [insight.get("confidence") for insight in insights],
-        "timestamp": datetime.now().isoformat()
     }
+    if _LANGSMITH_ENABLED:
+        report["timestamp"] = datetime.now().isoformat()
+    return report
 
 
-@traceable(name="echochamber_content_filtering")
+@_traceable(name="echochamber_content_filtering")
 def trace_content_filtering(content_items: List[Dict], filtered_count: int, filter_reasons: List[str]) -> Dict[str, Any]:
     """Traceable function for content filtering decisions."""
-    return {
+    report = {
         "total_content": len(content_items),
         "filtered_count": filtered_count,
         "filter_reasons": filter_reasons,
         "filtering_rate": filtered_count / len(content_items) if content_items else 0,
-        "timestamp": datetime.now().isoformat()
     }
+    if _LANGSMITH_ENABLED:
+        report["timestamp"] = datetime.now().isoformat()
+    return report
 
 
 # Global monitor instance
@@ -445,5 +898,11 @@ def get_monitoring_callbacks():
 
 
 def setup_workflow_monitoring(workflow_id: str, workflow_type: str, campaign_id: str) -> Optional[str]:
-    """Setup monitoring for a new workflow execution."""
-    return global_monitor.create_workflow_run(workflow_id, workflow_type, campaign_id)
\ No newline at end of file
+    """Setup monitoring for a new workflow execution.
+
+    The run id is also published to a task-local ContextVar so
+    ``monitor_node_execution`` can pick it up without state mutation.
+    """
+    run_id = global_monitor.create_workflow_run(workflow_id, workflow_type, campaign_id)
+    _run_id_var.set(run_id)
+    return run_id
\ No newline at end of file
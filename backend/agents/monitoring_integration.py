@@ -8,16 +8,27 @@ This module provides:
 - Error monitoring and alerting
 """
 
+import asyncio
+import hashlib
 import logging
+import re
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from collections import Counter, OrderedDict, deque
+from typing import Dict, Any, List, Optional, Pattern
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
+
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# When monitoring is switched off, decorators return the original
+# function untouched so traced paths pay no extra frame per call
+_MONITORING_ENABLED = getattr(settings, 'MONITORING_ENABLED', True)
+
 # Try to import LangSmith (optional dependency)
 try:
     from langsmith import Client as LangSmithClient
@@ -33,6 +44,94 @@ except ImportError:
             return func
         return decorator
 
+# Try to import Hyperscan (optional dependency, accelerates guardrail scans)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+# Output redaction: one fused regex compiled at module load, applied in a
+# single pass with a per-group replacement. The API-key group is anchored
+# to known secret prefixes (OpenAI/Stripe sk-/pk_, AWS AKIA, GitHub ghp_)
+# rather than "any 32+ alphanumerics", which used to redact ordinary long
+# URLs and slugs
+_REDACT_RE = re.compile(
+    r"(?P<api>\b(?:sk-[A-Za-z0-9_-]{20,}|pk_[A-Za-z0-9]{20,}|AKIA[0-9A-Z]{16}|gh[pousr]_[A-Za-z0-9]{36})\b)"
+    # Generic fallback for long opaque tokens whose prefix we don't know
+    r"|(?P<token>\b[A-Za-z0-9_-]{32,}\b)"
+    r"|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)"
+    r"|(?P<phone>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)"
+)
+_REDACT_MAP = {
+    "api": "[REDACTED]",
+    "token": "[REDACTED]",
+    "email": "[EMAIL_REDACTED]",
+    "phone": "[PHONE_REDACTED]"
+}
+
+
+def _redact_match(match) -> str:
+    return _REDACT_MAP[match.lastgroup]
+
+
+class _AhoCorasick:
+    """
+    Minimal Aho-Corasick automaton for case-insensitive literal matching.
+
+    Built once from a list of literal strings, it finds the first literal
+    occurring anywhere in a text in a single pass, regardless of how many
+    literals are registered. Used for the blocked-pattern check so the cost
+    no longer scales with the size of the blocklist.
+    """
+
+    def __init__(self, literals: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Optional[str]] = [None]
+        for literal in literals:
+            self._insert(literal.lower())
+        self._build_failure_links()
+
+    def _insert(self, literal: str):
+        state = 0
+        for char in literal:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+                next_state = len(self._goto) - 1
+                self._goto[state][char] = next_state
+            state = next_state
+        self._out[state] = literal
+
+    def _build_failure_links(self):
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                if self._out[next_state] is None:
+                    self._out[next_state] = self._out[self._fail[next_state]]
+
+    def first_match(self, text: str) -> Optional[str]:
+        """Return the first registered literal found in text, or None."""
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._out[state] is not None:
+                return self._out[state]
+        return None
+
 
 class Guardrails:
     """
@@ -79,7 +178,7 @@ class Guardrails:
 
     # Hate speech patterns (slurs, discriminatory language)
     HATE_SPEECH_PATTERNS = [
-        r'\bn\*{2,}[aer]{1,2}\b', r'\bn[i1]gg[aer]{1,2}(?:s)?\b',  # Racial slurs (N-word variants)
+        r'\bn\*{2,}[aer]{1,2}\b', r'\bnigg[aer]{1,2}(?:s)?\b',  # Racial slurs (N-word variants)
         r'\bf\*g{1,2}[ot]{0,2}\b', r'\bfag{1,2}[ot]{0,2}(?:s)?\b',  # Homophobic slurs
         r'\bc\*nt\b', r'\bcunt\b',  # Misogynistic slurs
         r'\bretard(?:s|ed)?\b', r'\bspaz\b',  # Ableist slurs
@@ -142,37 +241,198 @@ class Guardrails:
         r'\byou must (?:ignore|disregard|forget)\b'
     ]
 
-    # Rate limiting (in-memory, simple implementation)
-    _query_counts = {}
+    @staticmethod
+    def _fuse_patterns(patterns: List[str]) -> Pattern:
+        """Fuse a pattern list into one alternation regex with named groups.
+
+        Each pattern becomes a named group ``p<index>`` so a match can be
+        traced back to the original pattern string via ``match.lastgroup``.
+        A single fused scan makes one pass over the query instead of one
+        pass per pattern. Duplicate patterns are dropped (order-preserving)
+        so they do not bloat the compiled alternation.
+        """
+        return re.compile(
+            "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(dict.fromkeys(patterns))),
+            re.IGNORECASE
+        )
+
+    # Aho-Corasick automaton over the blocked literals (built once; finds
+    # any blocklist hit in a single pass over the query)
+    _BLOCKED_MATCHER = _AhoCorasick(BLOCKED_PATTERNS)
+
+    @staticmethod
+    def _build_hyperscan_db(patterns: List[str]):
+        """Compile a Hyperscan block-mode database for a pattern list.
+
+        Returns None when Hyperscan is unavailable or the patterns use
+        constructs it cannot compile, in which case the caller falls back
+        to the fused regex for the category.
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        try:
+            db = hyperscan.Database()
+            flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            db.compile(
+                expressions=[p.encode() for p in patterns],
+                ids=list(range(len(patterns))),
+                flags=[flags] * len(patterns)
+            )
+            return db
+        except Exception as e:
+            logger.warning("Hyperscan compile failed, falling back to regex: %s", e)
+            return None
+
+    # Fused category regexes (compiled once at class definition time;
+    # the string lists above are kept for readability and debugging)
+    _COMPILED_PROMPT_INJECTION = _fuse_patterns(PROMPT_INJECTION_PATTERNS)
+    _COMPILED_HARMFUL_INTENT = _fuse_patterns(HARMFUL_INTENT_PATTERNS)
+    _COMPILED_HATE_SPEECH = _fuse_patterns(HATE_SPEECH_PATTERNS)
+    _COMPILED_PROFANITY = _fuse_patterns(PROFANITY_PATTERNS)
+
+    # Optional Hyperscan databases (None when unavailable; the fused
+    # regexes above are the fallback)
+    _HS_PROMPT_INJECTION = _build_hyperscan_db(PROMPT_INJECTION_PATTERNS)
+    _HS_HARMFUL_INTENT = _build_hyperscan_db(HARMFUL_INTENT_PATTERNS)
+    _HS_HATE_SPEECH = _build_hyperscan_db(HATE_SPEECH_PATTERNS)
+    _HS_PROFANITY = _build_hyperscan_db(PROFANITY_PATTERNS)
+
+    # Category checks in their current scan order. Hit counts are kept
+    # per category and the list is re-sorted by descending hit rate every
+    # REORDER_INTERVAL scans, so the most commonly triggered category is
+    # tried (and exits) first
+    _CATEGORY_CHECKS = [
+        ["prompt_injection", _COMPILED_PROMPT_INJECTION, _HS_PROMPT_INJECTION],
+        ["harmful_intent", _COMPILED_HARMFUL_INTENT, _HS_HARMFUL_INTENT],
+        ["hate_speech", _COMPILED_HATE_SPEECH, _HS_HATE_SPEECH],
+        ["profanity", _COMPILED_PROFANITY, _HS_PROFANITY],
+    ]
+    _category_hits = Counter()
+    _scan_count = 0
+    REORDER_INTERVAL = 10_000
+
+    # Leet-speak normalization: common digit/symbol substitutions are
+    # folded back to letters in one str.translate pass before the
+    # category scans, so "sh1t" or "a$$" match the plain patterns
+    # without keeping an obfuscated variant of every word. Asterisk
+    # masking ("f**k") is left to the dedicated patterns since deleting
+    # the mask cannot restore the missing letters
+    _LEET_TABLE = str.maketrans({'3': 'e', '1': 'i', '0': 'o', '@': 'a', '$': 's', '!': 'i'})
+
+    # Rate limiting (in-memory, simple implementation): counters are
+    # sharded by user hash, each shard guarded by its own lock so request
+    # threads only contend when they land on the same shard. A shard is a
+    # [minute, counts] pair; its counts dict is swapped wholesale when the
+    # minute advances instead of expiring old user-minute keys one by one
+    _RATE_SHARD_COUNT = 16
+    _rate_shards = [(threading.Lock(), [0, {}]) for _ in range(_RATE_SHARD_COUNT)]
     MAX_QUERIES_PER_MINUTE = 30
 
-    # OpenAI Moderation API client (lazy initialization)
+    # OpenAI Moderation API clients (lazy initialization)
     _openai_client = None
+    _openai_async_client = None
+
+    # Moderation verdict cache: repeated or templated queries (bots,
+    # reload spam) would otherwise hit the API every time. Keyed by a
+    # short blake2b digest of the query; verdicts are (flagged,
+    # categories) tuples. Shared by the sync and async paths
+    MODERATION_CACHE_SIZE = 4096
+    _moderation_cache: "OrderedDict[str, tuple]" = OrderedDict()
+    _moderation_cache_lock = threading.Lock()
+
+    @classmethod
+    def _moderation_cache_get(cls, key: str) -> Optional[tuple]:
+        with cls._moderation_cache_lock:
+            verdict = cls._moderation_cache.get(key)
+            if verdict is not None:
+                cls._moderation_cache.move_to_end(key)
+            return verdict
 
     @classmethod
-    def _check_patterns(cls, query: str, patterns: List[str], pattern_type: str) -> Optional[Dict[str, Any]]:
+    def _moderation_cache_put(cls, key: str, verdict: tuple):
+        with cls._moderation_cache_lock:
+            cls._moderation_cache[key] = verdict
+            cls._moderation_cache.move_to_end(key)
+            while len(cls._moderation_cache) > cls.MODERATION_CACHE_SIZE:
+                cls._moderation_cache.popitem(last=False)
+
+    @staticmethod
+    def _moderation_cache_key(query: str) -> str:
+        return hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+
+    @classmethod
+    def _check_patterns(cls, query: str, fused_pattern: Pattern, pattern_type: str,
+                        hs_db=None) -> Optional[Dict[str, Any]]:
         """
-        Helper method to check query against a list of regex patterns.
+        Helper method to check query against a category's patterns.
+
+        Scans with the category's Hyperscan database when one was built,
+        otherwise with the fused category regex.
 
         Args:
             query: User's query string
-            patterns: List of regex patterns to check
+            fused_pattern: Fused alternation regex for the category
             pattern_type: Type of pattern for logging (e.g., "profanity", "hate_speech")
+            hs_db: Optional Hyperscan database for the category
 
         Returns:
             Error dict if pattern matched, None otherwise
         """
-        import re
+        if hs_db is not None:
+            matched_ids = []
+            # The handler must return a falsy value: a truthy return makes
+            # hyperscan raise ScanTerminated instead of stopping cleanly.
+            # HS_FLAG_SINGLEMATCH already caps callbacks at one per pattern.
+            hs_db.scan(query.encode(), match_event_handler=lambda pid, start, end, flags, ctx: matched_ids.append(pid))
+            if not matched_ids:
+                return None
+            logger.warning("%s pattern detected in query: pattern index %s", pattern_type, matched_ids[0])
+        else:
+            match = fused_pattern.search(query)
+            if not match:
+                return None
+            logger.warning("%s pattern detected in query: group %s matched %r", pattern_type, match.lastgroup, match.group())
+        return {
+            "valid": False,
+            "error": f"Query contains inappropriate content and cannot be processed.",
+            "code": pattern_type.upper()
+        }
+
+    @classmethod
+    def _scan_patterns(cls, query_lower: str) -> Optional[Dict[str, Any]]:
+        """
+        Run the local pattern checks over the lowercased query.
+
+        Args:
+            query_lower: Lowercased query string
+
+        Returns:
+            Error dict from the first failing check, None if all pass
+        """
+        # Check for blocked patterns (SQL injection, XSS, code execution)
+        blocked_hit = cls._BLOCKED_MATCHER.first_match(query_lower)
+        if blocked_hit:
+            logger.warning("Blocked pattern detected in query: %s", blocked_hit)
+            return {
+                "valid": False,
+                "error": "Query contains potentially harmful content.",
+                "code": "BLOCKED_PATTERN"
+            }
+
+        # Category checks (prompt injection, harmful intent, hate speech,
+        # profanity) over the leet-normalized query, most frequently
+        # triggered first
+        cls._scan_count += 1
+        if cls._scan_count % cls.REORDER_INTERVAL == 0:
+            cls._CATEGORY_CHECKS.sort(key=lambda check: -cls._category_hits[check[0]])
+
+        normalized = query_lower.translate(cls._LEET_TABLE)
+        for pattern_type, fused_pattern, hs_db in cls._CATEGORY_CHECKS:
+            result = cls._check_patterns(normalized, fused_pattern, pattern_type, hs_db=hs_db)
+            if result:
+                cls._category_hits[pattern_type] += 1
+                return result
 
-        query_lower = query.lower()
-        for pattern in patterns:
-            if re.search(pattern, query_lower, re.IGNORECASE):
-                logger.warning(f"{pattern_type} pattern detected in query: {pattern}")
-                return {
-                    "valid": False,
-                    "error": f"Query contains inappropriate content and cannot be processed.",
-                    "code": pattern_type.upper()
-                }
         return None
 
     @classmethod
@@ -187,8 +447,6 @@ class Guardrails:
         Returns:
             Dictionary with validation result
         """
-        import re
-
         # Check query length
         if len(query) < cls.MIN_QUERY_LENGTH:
             return {
@@ -204,40 +462,48 @@ class Guardrails:
                 "code": "QUERY_TOO_LONG"
             }
 
-        # Check for blocked patterns (SQL injection, XSS, code execution)
-        query_upper = query.upper()
-        for pattern in cls.BLOCKED_PATTERNS:
-            if pattern.upper() in query_upper:
-                logger.warning(f"Blocked pattern detected in query: {pattern}")
-                return {
-                    "valid": False,
-                    "error": "Query contains potentially harmful content.",
-                    "code": "BLOCKED_PATTERN"
-                }
+        # Lowercase once; every category check below is case-insensitive
+        # so they can all share the same string
+        query_lower = query.lower()
 
-        # Check for prompt injection attempts (jailbreaking)
-        result = cls._check_patterns(query, cls.PROMPT_INJECTION_PATTERNS, "prompt_injection")
+        # Blocked literals and the four pattern categories
+        result = cls._scan_patterns(query_lower)
         if result:
             return result
 
-        # Check for harmful intent (violence, illegal activities, manipulation)
-        result = cls._check_patterns(query, cls.HARMFUL_INTENT_PATTERNS, "harmful_intent")
+        # OpenAI Moderation API check (optional, for comprehensive moderation)
+        result = cls._moderate_sync(query)
         if result:
             return result
 
-        # Check for hate speech (slurs, discrimination)
-        result = cls._check_patterns(query, cls.HATE_SPEECH_PATTERNS, "hate_speech")
+        # Rate limiting (simple in-memory implementation)
+        result = cls._check_rate_limit(user_id)
         if result:
             return result
 
-        # Check for profanity
-        result = cls._check_patterns(query, cls.PROFANITY_PATTERNS, "profanity")
-        if result:
-            return result
+        return {
+            "valid": True,
+            "code": "OK"
+        }
 
-        # OpenAI Moderation API check (optional, for comprehensive moderation)
-        if hasattr(settings, 'OPENAI_API_KEY') and settings.OPENAI_API_KEY:
-            try:
+    @classmethod
+    def _moderate_sync(cls, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Run the Moderation API check with verdict caching (sync path).
+
+        Args:
+            query: User's query string
+
+        Returns:
+            Error dict when the query is flagged, None otherwise
+        """
+        if not (hasattr(settings, 'OPENAI_API_KEY') and settings.OPENAI_API_KEY):
+            return None
+
+        try:
+            cache_key = cls._moderation_cache_key(query)
+            verdict = cls._moderation_cache_get(cache_key)
+            if verdict is None:
                 # Initialize OpenAI client if not already done
                 if cls._openai_client is None:
                     from openai import OpenAI
@@ -246,47 +512,158 @@ class Guardrails:
                 # Call Moderation API
                 moderation_response = cls._openai_client.moderations.create(input=query)
                 result = moderation_response.results[0]
+                flagged_categories = (
+                    [cat for cat, flagged in result.categories.model_dump().items() if flagged]
+                    if result.flagged else []
+                )
+                verdict = (result.flagged, flagged_categories)
+                cls._moderation_cache_put(cache_key, verdict)
+
+            # Check if content is flagged
+            if verdict[0]:
+                logger.warning("OpenAI Moderation flagged query. Categories: %s", verdict[1])
+                return {
+                    "valid": False,
+                    "error": "Query contains inappropriate content and cannot be processed.",
+                    "code": "MODERATION_FLAGGED",
+                    "categories": verdict[1]
+                }
+        except ImportError:
+            logger.warning("OpenAI library not available for moderation. Install with: pip install openai")
+        except Exception as e:
+            logger.error("OpenAI Moderation API error: %s", e)
+            # Continue without OpenAI moderation if it fails
+
+        return None
+
+    @classmethod
+    async def _async_moderate(cls, query: str):
+        """Call the Moderation API with the shared async client."""
+        if cls._openai_async_client is None:
+            from openai import AsyncOpenAI
+            cls._openai_async_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        response = await cls._openai_async_client.moderations.create(input=query)
+        return response.results[0]
+
+    @classmethod
+    async def validate_query_async(cls, query: str, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of validate_query that overlaps the Moderation API
+        round-trip with the local checks.
+
+        The moderation call is scheduled before the pattern scans run, so
+        its network time is not added serially on top of them; the task is
+        awaited only once every local check has passed, and cancelled when
+        one fails.
+
+        Args:
+            query: User's query string
+            user_id: Optional user identifier for rate limiting
+
+        Returns:
+            Dictionary with validation result
+        """
+        # Check query length
+        if len(query) < cls.MIN_QUERY_LENGTH:
+            return {
+                "valid": False,
+                "error": f"Query too short. Minimum {cls.MIN_QUERY_LENGTH} characters required.",
+                "code": "QUERY_TOO_SHORT"
+            }
+
+        if len(query) > cls.MAX_QUERY_LENGTH:
+            return {
+                "valid": False,
+                "error": f"Query too long. Maximum {cls.MAX_QUERY_LENGTH} characters allowed.",
+                "code": "QUERY_TOO_LONG"
+            }
+
+        query_lower = query.lower()
+
+        # Kick off moderation before scanning so the RTT overlaps the
+        # local checks; a cached verdict skips the call entirely
+        moderation_task = None
+        verdict = None
+        cache_key = None
+        if hasattr(settings, 'OPENAI_API_KEY') and settings.OPENAI_API_KEY:
+            cache_key = cls._moderation_cache_key(query)
+            verdict = cls._moderation_cache_get(cache_key)
+            if verdict is None:
+                moderation_task = asyncio.create_task(cls._async_moderate(query))
+
+        result = cls._scan_patterns(query_lower)
+        if result:
+            if moderation_task:
+                moderation_task.cancel()
+            return result
 
-                # Check if content is flagged
-                if result.flagged:
-                    flagged_categories = [cat for cat, flagged in result.categories.model_dump().items() if flagged]
-                    logger.warning(f"OpenAI Moderation flagged query. Categories: {flagged_categories}")
-                    return {
-                        "valid": False,
-                        "error": "Query contains inappropriate content and cannot be processed.",
-                        "code": "MODERATION_FLAGGED",
-                        "categories": flagged_categories
-                    }
+        if moderation_task:
+            try:
+                mod_result = await moderation_task
+                flagged_categories = (
+                    [cat for cat, flagged in mod_result.categories.model_dump().items() if flagged]
+                    if mod_result.flagged else []
+                )
+                verdict = (mod_result.flagged, flagged_categories)
+                cls._moderation_cache_put(cache_key, verdict)
             except ImportError:
                 logger.warning("OpenAI library not available for moderation. Install with: pip install openai")
             except Exception as e:
-                logger.error(f"OpenAI Moderation API error: {e}")
+                logger.error("OpenAI Moderation API error: %s", e)
                 # Continue without OpenAI moderation if it fails
 
+        if verdict and verdict[0]:
+            logger.warning("OpenAI Moderation flagged query. Categories: %s", verdict[1])
+            return {
+                "valid": False,
+                "error": "Query contains inappropriate content and cannot be processed.",
+                "code": "MODERATION_FLAGGED",
+                "categories": verdict[1]
+            }
+
         # Rate limiting (simple in-memory implementation)
-        if user_id:
-            current_minute = int(time.time() / 60)
-            key = f"{user_id}:{current_minute}"
-
-            if key in cls._query_counts:
-                cls._query_counts[key] += 1
-                if cls._query_counts[key] > cls.MAX_QUERIES_PER_MINUTE:
-                    return {
-                        "valid": False,
-                        "error": "Rate limit exceeded. Please wait before making more queries.",
-                        "code": "RATE_LIMIT_EXCEEDED"
-                    }
-            else:
-                # Clean up old entries
-                cls._query_counts = {k: v for k, v in cls._query_counts.items()
-                                    if k.split(':')[1] == str(current_minute)}
-                cls._query_counts[key] = 1
+        result = cls._check_rate_limit(user_id)
+        if result:
+            return result
 
         return {
             "valid": True,
             "code": "OK"
         }
 
+    @classmethod
+    def _check_rate_limit(cls, user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Apply in-memory per-user rate limiting.
+
+        Args:
+            user_id: User identifier (no-op when None)
+
+        Returns:
+            Error dict if the limit is exceeded, None otherwise
+        """
+        if not user_id:
+            return None
+
+        current_minute = int(time.time() // 60)
+        lock, shard = cls._rate_shards[hash(user_id) & (cls._RATE_SHARD_COUNT - 1)]
+        with lock:
+            if shard[0] != current_minute:
+                shard[0] = current_minute
+                shard[1] = {}
+            counts = shard[1]
+            count = counts.get(user_id, 0) + 1
+            counts[user_id] = count
+
+        if count > cls.MAX_QUERIES_PER_MINUTE:
+            return {
+                "valid": False,
+                "error": "Rate limit exceeded. Please wait before making more queries.",
+                "code": "RATE_LIMIT_EXCEEDED"
+            }
+
+        return None
+
     @classmethod
     def sanitize_output(cls, output: str) -> str:
         """
@@ -298,22 +675,92 @@ class Guardrails:
         Returns:
             Sanitized output
         """
-        # Remove potential API keys (simple pattern matching)
-        import re
+        # Redact API keys, emails and phone numbers in one pass over the
+        # output with the fused module-level regex
+        return _REDACT_RE.sub(_redact_match, output)
+
+
+# Specialized validate_query: every limit, pattern and the category order
+# are known once the class is defined, so a closed-form validator is
+# generated at import time with the length constants baked in and the
+# category checks unrolled against closure references to the compiled
+# regexes — no per-call dispatch through _check_patterns/_scan_patterns.
+# The generated function is reinstalled whenever the category order is
+# re-sorted by hit rate.
+_scan_state = [0]
+
+
+def _reorder_validate_impl():
+    """Re-sort category checks by hit rate and regenerate the validator."""
+    Guardrails._CATEGORY_CHECKS.sort(key=lambda check: -Guardrails._category_hits[check[0]])
+    _install_validate_impl()
+
+
+def _build_validate_impl():
+    g = Guardrails
+    ns = {
+        "logger": logger,
+        "_first_blocked": g._BLOCKED_MATCHER.first_match,
+        "_check_rate_limit": g._check_rate_limit,
+        "_moderate_sync": g._moderate_sync,
+        "_category_hits": g._category_hits,
+        "_leet_table": g._LEET_TABLE,
+        "_reorder": _reorder_validate_impl,
+        "_scan_state": _scan_state,
+    }
+    lines = [
+        "def _validate_impl(query, user_id=None):",
+        '    """Validate user query against guardrails (generated at import)."""',
+        "    qlen = len(query)",
+        "    if qlen < %d:" % g.MIN_QUERY_LENGTH,
+        '        return {"valid": False, "error": "Query too short. Minimum %d characters required.", "code": "QUERY_TOO_SHORT"}' % g.MIN_QUERY_LENGTH,
+        "    if qlen > %d:" % g.MAX_QUERY_LENGTH,
+        '        return {"valid": False, "error": "Query too long. Maximum %d characters allowed.", "code": "QUERY_TOO_LONG"}' % g.MAX_QUERY_LENGTH,
+        "    query_lower = query.lower()",
+        "    n = _scan_state[0] + 1",
+        "    _scan_state[0] = n",
+        "    normalized = query_lower.translate(_leet_table)",
+        "    blocked_hit = _first_blocked(query_lower)",
+        "    if blocked_hit is not None:",
+        '        logger.warning("Blocked pattern detected in query: %s", blocked_hit)',
+        '        return {"valid": False, "error": "Query contains potentially harmful content.", "code": "BLOCKED_PATTERN"}',
+    ]
+    for i, (pattern_type, fused_pattern, _hs_db) in enumerate(g._CATEGORY_CHECKS):
+        ns["_search_%d" % i] = fused_pattern.search
+        lines += [
+            "    match = _search_%d(normalized)" % i,
+            "    if match is not None:",
+            '        _category_hits["%s"] += 1' % pattern_type,
+            '        logger.warning("%%s pattern detected in query: group %%s matched %%r", "%s", match.lastgroup, match.group())' % pattern_type,
+            '        return {"valid": False, "error": "Query contains inappropriate content and cannot be processed.", "code": "%s"}' % pattern_type.upper(),
+        ]
+    lines += [
+        "    if n %% %d == 0:" % g.REORDER_INTERVAL,
+        "        _reorder()",
+        "    result = _moderate_sync(query)",
+        "    if result is not None:",
+        "        return result",
+        "    result = _check_rate_limit(user_id)",
+        "    if result is not None:",
+        "        return result",
+        '    return {"valid": True, "code": "OK"}',
+    ]
+    exec("\n".join(lines), ns)
+    return ns["_validate_impl"]
 
-        # Pattern for API keys (basic heuristic)
-        api_key_pattern = r'[a-zA-Z0-9_-]{32,}'
-        output = re.sub(api_key_pattern, '[REDACTED]', output)
 
-        # Remove email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        output = re.sub(email_pattern, '[EMAIL_REDACTED]', output)
+def _install_validate_impl():
+    """Install the specialized validator as Guardrails.validate_query.
+
+    Skipped when a Hyperscan database is active for any category — the
+    general classmethod path already handles that case.
+    """
+    if any(check[2] is not None for check in Guardrails._CATEGORY_CHECKS):
+        return
+    Guardrails.validate_query = staticmethod(_build_validate_impl())
 
-        # Remove phone numbers (basic pattern)
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        output = re.sub(phone_pattern, '[PHONE_REDACTED]', output)
 
-        return output
+_install_validate_impl()
 
 
 class PerformanceMetrics:
@@ -327,8 +774,33 @@ class PerformanceMetrics:
     - Result relevance scores
     """
 
-    _metrics = []
+    # Struct-of-arrays ring buffer: one numpy array per numeric column,
+    # written at _write_ptr modulo the cap. Statistics are then single
+    # vectorized reductions over contiguous memory instead of Python
+    # loops over up to a thousand per-query dicts
     MAX_METRICS_STORED = 1000  # Keep last 1000 queries
+    _exec_time = np.zeros(MAX_METRICS_STORED, dtype=np.float32)
+    _success = np.zeros(MAX_METRICS_STORED, dtype=np.bool_)
+    _result_count = np.zeros(MAX_METRICS_STORED, dtype=np.int32)
+    _intent_idx = np.zeros(MAX_METRICS_STORED, dtype=np.int16)
+    _ts = np.zeros(MAX_METRICS_STORED, dtype=np.float64)
+    _intent_vocab: Dict[str, int] = {}
+    _intent_names: List[str] = []
+    _tool_counter = Counter()
+    _write_ptr = 0
+    _count = 0
+    _lock = threading.Lock()
+
+    # Running aggregates, updated in O(1) per record so the default
+    # statistics read never has to scan the ring. Sum/success/intent
+    # counts are exact over the ring window (evicted records are
+    # subtracted); max/min are since service start, as an exact sliding
+    # extremum would need a monotonic deque for little practical gain
+    _sum_time = 0.0
+    _success_total = 0
+    _max_time = 0.0
+    _min_time = float("inf")
+    _intent_counter = Counter()
 
     @classmethod
     def record_query(
@@ -353,27 +825,40 @@ class PerformanceMetrics:
             success: Whether query succeeded
             metadata: Additional metadata
         """
-        metric = {
-            "timestamp": datetime.now().isoformat(),
-            "query_length": len(query),
-            "execution_time": execution_time,
-            "intent_type": intent_type,
-            "tools_executed": tools_executed,
-            "tool_count": len(tools_executed),
-            "result_count": result_count,
-            "success": success,
-            "metadata": metadata or {}
-        }
-
-        cls._metrics.append(metric)
-
-        # Keep only recent metrics
-        if len(cls._metrics) > cls.MAX_METRICS_STORED:
-            cls._metrics = cls._metrics[-cls.MAX_METRICS_STORED:]
+        intent = intent_type or "unknown"
+        with cls._lock:
+            idx = cls._write_ptr % cls.MAX_METRICS_STORED
+
+            # Subtract the contributions of the record being evicted so
+            # the running aggregates stay exact over the ring window
+            if cls._count == cls.MAX_METRICS_STORED:
+                cls._sum_time -= float(cls._exec_time[idx])
+                cls._success_total -= int(cls._success[idx])
+                cls._intent_counter[cls._intent_names[cls._intent_idx[idx]]] -= 1
+
+            cls._exec_time[idx] = execution_time
+            cls._success[idx] = success
+            cls._result_count[idx] = result_count
+            intent_id = cls._intent_vocab.setdefault(intent, len(cls._intent_vocab))
+            if intent_id == len(cls._intent_names):
+                cls._intent_names.append(intent)
+            cls._intent_idx[idx] = intent_id
+            # Epoch float; formatted to ISO only on statistics reads
+            cls._ts[idx] = time.time()
+            cls._tool_counter.update(tools_executed)
+            cls._write_ptr += 1
+            cls._count = min(cls._count + 1, cls.MAX_METRICS_STORED)
+
+            stored_time = float(cls._exec_time[idx])
+            cls._sum_time += stored_time
+            cls._success_total += int(bool(success))
+            cls._max_time = max(cls._max_time, stored_time)
+            cls._min_time = min(cls._min_time, stored_time)
+            cls._intent_counter[intent] += 1
 
         # Log slow queries
         if execution_time > 5.0:
-            logger.warning(f"Slow query detected: {execution_time:.2f}s for query: {query[:100]}")
+            logger.warning("Slow query detected: %.2fs for query: %s", execution_time, query[:100])
 
     @classmethod
     def get_statistics(cls, last_n: Optional[int] = None) -> Dict[str, Any]:
@@ -386,50 +871,67 @@ class PerformanceMetrics:
         Returns:
             Dictionary with statistics
         """
-        if not cls._metrics:
+        with cls._lock:
+            count = cls._count
+            write_ptr = cls._write_ptr
+            intent_vocab = dict(cls._intent_vocab)
+            tool_counts = dict(cls._tool_counter)
+            sum_time = cls._sum_time
+            success_total = cls._success_total
+            max_time = cls._max_time
+            min_time = cls._min_time
+            intent_counter = dict(cls._intent_counter)
+
+        if count == 0:
             return {
                 "total_queries": 0,
                 "message": "No metrics recorded yet"
             }
 
-        metrics = cls._metrics[-last_n:] if last_n else cls._metrics
+        if last_n and last_n < count:
+            # Windowed read: reduce over the requested slice of the ring
+            total_queries = last_n
+            window = np.arange(write_ptr - total_queries, write_ptr) % cls.MAX_METRICS_STORED
+
+            execution_times = cls._exec_time[window]
+            avg_time = float(execution_times.mean())
+            max_time = float(execution_times.max())
+            min_time = float(execution_times.min())
+            successful_queries = int(cls._success[window].sum())
+
+            # Intent distribution (bincount over the vocabulary-encoded column)
+            intent_names = {intent_id: intent for intent, intent_id in intent_vocab.items()}
+            intent_bins = np.bincount(cls._intent_idx[window], minlength=len(intent_vocab))
+            intent_counts = {intent_names[i]: int(n) for i, n in enumerate(intent_bins) if n}
+            first_idx = int(window[0])
+            last_idx = int(window[-1])
+        else:
+            # Default read: running aggregates, no scan (max/min are
+            # since service start)
+            total_queries = count
+            avg_time = sum_time / count
+            successful_queries = success_total
+            intent_counts = {intent: n for intent, n in intent_counter.items() if n}
+            first_idx = (write_ptr - count) % cls.MAX_METRICS_STORED
+            last_idx = (write_ptr - 1) % cls.MAX_METRICS_STORED
 
-        total_queries = len(metrics)
-        successful_queries = sum(1 for m in metrics if m["success"])
         failed_queries = total_queries - successful_queries
 
-        execution_times = [m["execution_time"] for m in metrics]
-        avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0
-        max_execution_time = max(execution_times) if execution_times else 0
-        min_execution_time = min(execution_times) if execution_times else 0
-
-        # Intent distribution
-        intent_counts = {}
-        for m in metrics:
-            intent = m.get("intent_type", "unknown")
-            intent_counts[intent] = intent_counts.get(intent, 0) + 1
-
-        # Tool usage
-        tool_counts = {}
-        for m in metrics:
-            for tool in m.get("tools_executed", []):
-                tool_counts[tool] = tool_counts.get(tool, 0) + 1
-
         return {
             "total_queries": total_queries,
             "successful_queries": successful_queries,
             "failed_queries": failed_queries,
             "success_rate": round(successful_queries / total_queries, 3) if total_queries > 0 else 0,
             "execution_time": {
-                "avg_seconds": round(avg_execution_time, 3),
-                "max_seconds": round(max_execution_time, 3),
-                "min_seconds": round(min_execution_time, 3)
+                "avg_seconds": round(avg_time, 3),
+                "max_seconds": round(max_time, 3),
+                "min_seconds": round(min_time, 3)
             },
             "intent_distribution": intent_counts,
             "tool_usage": tool_counts,
             "period": {
-                "first_query": metrics[0]["timestamp"] if metrics else None,
-                "last_query": metrics[-1]["timestamp"] if metrics else None
+                "first_query": datetime.fromtimestamp(float(cls._ts[first_idx])).isoformat(),
+                "last_query": datetime.fromtimestamp(float(cls._ts[last_idx])).isoformat()
             }
         }
 
@@ -455,7 +957,7 @@ class LangSmithTracer:
                 )
                 logger.info("LangSmith tracing enabled")
             except Exception as e:
-                logger.warning(f"Failed to initialize LangSmith client: {e}")
+                logger.warning("Failed to initialize LangSmith client: %s", e)
                 self.enabled = False
         else:
             logger.info("LangSmith tracing disabled (not configured)")
@@ -565,9 +1067,12 @@ def monitoring_decorator(func):
         async def my_function(...):
             ...
     """
+    if not _MONITORING_ENABLED:
+        return func
+
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         error = None
 
@@ -577,17 +1082,18 @@ def monitoring_decorator(func):
             return result
         except Exception as e:
             error = str(e)
-            logger.error(f"Error in {func.__name__}: {e}")
+            logger.error("Error in %s: %s", func.__name__, e)
             raise
         finally:
-            execution_time = time.time() - start_time
-            logger.info(
-                f"{func.__name__} completed in {execution_time:.2f}s "
-                f"(success={success})"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                execution_time = time.perf_counter() - start_time
+                logger.info(
+                    "%s completed in %.2fs (success=%s)",
+                    func.__name__, execution_time, success
+                )
 
             if error:
-                logger.error(f"{func.__name__} failed: {error}")
+                logger.error("%s failed: %s", func.__name__, error)
 
     return wrapper
 
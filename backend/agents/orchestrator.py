@@ -533,12 +533,10 @@ class EchoChamberWorkflowOrchestrator:
         workflow_id = f"{workflow_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         state = create_initial_state(workflow_id, campaign, config)
 
-        # Setup monitoring
+        # Setup monitoring (run id travels via a ContextVar to the nodes)
         monitoring_run_id = setup_workflow_monitoring(
             workflow_id, workflow_type, campaign.campaign_id
         )
-        if monitoring_run_id:
-            state._monitoring_run_id = monitoring_run_id
 
         try:
             # Execute the workflow with monitoring
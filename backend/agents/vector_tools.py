@@ -7,9 +7,13 @@ This module provides vector similarity search capabilities using pgvector:
 - Configurable similarity thresholds and result limits
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
-from django.db.models import Q, F
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q, F, FloatField, ExpressionWrapper
+from django.db.models.expressions import RawSQL
 
 from common.models import ProcessedContent, Insight, PainPoint
 from agents.embedding_service import embedding_service
@@ -17,6 +21,21 @@ from agents.embedding_service import embedding_service
 logger = logging.getLogger(__name__)
 
 
+# Per-search timeout inside the search_all fan-out. One cold content type
+# (e.g. an unwarmed pgvector index scan) should degrade that type to empty
+# results, not hold the whole RAG query hostage.
+SEARCH_ALL_TIMEOUT_SECONDS = 5.0
+
+
+async def _bounded_search(name: str, coro, timeout: float = SEARCH_ALL_TIMEOUT_SECONDS) -> Dict[str, Any]:
+    """Await a search coroutine, soft-failing to empty results on timeout."""
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Vector search '%s' timed out after %.1fs", name, timeout)
+        return {"success": False, "error": "timeout", "results": []}
+
+
 class VectorSearchTool:
     """
     Perform semantic similarity search using vector embeddings.
@@ -58,9 +77,6 @@ class VectorSearchTool:
             Dictionary with search results
         """
         try:
-            from asgiref.sync import sync_to_async
-            from django.db.models import FloatField, ExpressionWrapper
-            from django.db.models.expressions import RawSQL
             
             # Generate query embedding
             query_embedding = await embedding_service.generate_embedding(query)
@@ -167,9 +183,6 @@ class VectorSearchTool:
             Dictionary with search results
         """
         try:
-            from asgiref.sync import sync_to_async
-            from django.db.models import FloatField, ExpressionWrapper
-            from django.db.models.expressions import RawSQL
             
             logger.info(f"Searching insights: query='{query[:50]}...', min_similarity={min_similarity}")
             
@@ -274,9 +287,6 @@ class VectorSearchTool:
             Dictionary with search results
         """
         try:
-            from asgiref.sync import sync_to_async
-            from django.db.models import FloatField, ExpressionWrapper
-            from django.db.models.expressions import RawSQL
             
             logger.info(f"Searching pain points: query='{query[:50]}...', min_similarity={min_similarity}")
             
@@ -384,9 +394,6 @@ class VectorSearchTool:
             Dictionary with search results
         """
         try:
-            from asgiref.sync import sync_to_async
-            from django.db.models import FloatField, ExpressionWrapper
-            from django.db.models.expressions import RawSQL
             from common.models import Thread
             
             query_embedding = await embedding_service.generate_embedding(query)
@@ -489,9 +496,8 @@ class VectorSearchTool:
             Dictionary with results from all content types
         """
         try:
-            # Search all types in parallel
-            import asyncio
-
+            # Search all types in parallel, each bounded by a per-search
+            # timeout so one slow type degrades to partial results
             content_task = self.search_content(
                 query=query,
                 brand_id=brand_id,
@@ -527,7 +533,10 @@ class VectorSearchTool:
             )
 
             content_results, insights_results, pain_points_results, threads_results = await asyncio.gather(
-                content_task, insights_task, pain_points_task, threads_task
+                _bounded_search("content", content_task),
+                _bounded_search("insights", insights_task),
+                _bounded_search("pain_points", pain_points_task),
+                _bounded_search("threads", threads_task)
             )
 
             total_count = (
@@ -3541,7 +3541,7 @@ def monitoring_dashboard(request):
     try:
         from django.core.cache import cache
         from celery import current_app
-        from agents.monitoring import global_monitor
+        from agents.monitoring import global_monitor, _format_event
 
         # Get active tasks from Celery
         inspect = current_app.control.inspect()
@@ -3565,7 +3565,7 @@ def monitoring_dashboard(request):
         ).count()
 
         # Get monitoring events from global monitor
-        compliance_events = global_monitor.compliance_tracker.audit_events[-100:] if global_monitor.compliance_tracker.audit_events else []
+        compliance_events = [_format_event(e) for e in global_monitor.compliance_tracker.tail(100)]
 
         # Calculate error rate from recent events
         error_events = [e for e in compliance_events if e.get('event_type') in ['workflow_error', 'node_error']]
@@ -4355,7 +4355,7 @@ def agent_status_view(request):
         - LangSmith integration status
     """
     try:
-        from agents.monitoring import global_monitor
+        from agents.monitoring import global_monitor, _format_event
         from agents.monitoring_integration import performance_metrics, langsmith_tracer
         
         # Get performance statistics
@@ -4374,7 +4374,7 @@ def agent_status_view(request):
         # Get compliance events (last 50)
         compliance_events = []
         if global_monitor and hasattr(global_monitor, 'compliance_tracker'):
-            compliance_events = global_monitor.compliance_tracker.audit_events[-50:]
+            compliance_events = [_format_event(e) for e in global_monitor.compliance_tracker.tail(50)]
         
         # Determine RAG system health
         total_queries = perf_stats.get('total_queries', 0)
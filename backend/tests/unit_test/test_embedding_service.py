@@ -0,0 +1,51 @@
+"""
+Unit tests for the Embedding Service query path.
+
+Vector, hybrid, and RAG searches pass the result of generate_embedding
+straight into RawSQL params, and psycopg cannot adapt numpy arrays —
+these tests pin the query-path contract to plain Python floats.
+"""
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+class TestGenerateEmbeddingQueryPath:
+    """Test that single-query embeddings are adaptable by the DB driver."""
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_returns_plain_floats(self):
+        """generate_embedding must return a list of Python floats."""
+        from agents.embedding_service import EmbeddingService
+
+        service = EmbeddingService()
+        vectors = np.asarray([[0.1, 0.2, 0.3]], dtype=np.float32)
+
+        with patch.object(service, '_embed_texts',
+                          AsyncMock(return_value=(vectors, 5))):
+            result = await service.generate_embedding("pricing complaints")
+
+        # A numpy row (or np.float32 elements) would raise
+        # ProgrammingError: cannot adapt type 'ndarray' inside RawSQL
+        assert type(result) is list
+        assert all(type(value) is float for value in result)
+        assert result == pytest.approx([0.1, 0.2, 0.3])
+
+    @pytest.mark.asyncio
+    async def test_empty_text_placeholder_returns_plain_floats(self):
+        """The cached placeholder path must also return plain floats."""
+        from agents.embedding_service import EmbeddingService
+
+        service = EmbeddingService()
+        placeholder = np.asarray([[0.5, 0.5]], dtype=np.float32)
+
+        with patch.object(service, '_embed_texts',
+                          AsyncMock(return_value=(placeholder, 2))) as mock_embed:
+            first = await service.generate_embedding("   ")
+            second = await service.generate_embedding("")
+
+        # Placeholder is embedded once per process, then reused
+        assert mock_embed.await_count == 1
+        assert type(first) is list
+        assert all(type(value) is float for value in first)
+        assert first == second
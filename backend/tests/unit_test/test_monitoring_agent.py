@@ -31,10 +31,10 @@ class TestComplianceTracking:
 
         assert len(tracker.audit_events) == 1
         event = tracker.audit_events[0]
-        assert event["event_type"] == "pii_detection"
-        assert event["pii_type"] == "email"
-        assert event["action"] == "redacted"
-        assert event["compliance_level"] == "GDPR"
+        assert event.event_type == "pii_detection"
+        assert event.pii_type == "email"
+        assert event.action == "redacted"
+        assert event.compliance_level == "GDPR"
 
     def test_log_content_filtering(self):
         """Verify content filtering decisions are logged."""
@@ -48,9 +48,9 @@ class TestComplianceTracking:
 
         assert len(tracker.audit_events) == 1
         event = tracker.audit_events[0]
-        assert event["event_type"] == "content_filtering"
-        assert event["filter_reason"] == "profanity"
-        assert event["toxicity_score"] == 0.85
+        assert event.event_type == "content_filtering"
+        assert event.filter_reason == "profanity"
+        assert event.toxicity_score == 0.85
 
     def test_log_ai_decision(self):
         """Verify AI decision logging for explainability."""
@@ -64,9 +64,9 @@ class TestComplianceTracking:
 
         assert len(tracker.audit_events) == 1
         event = tracker.audit_events[0]
-        assert event["event_type"] == "ai_decision"
-        assert event["decision_type"] == "route_to_analyst"
-        assert event["compliance_level"] == "AI_Governance"
+        assert event.event_type == "ai_decision"
+        assert event.decision_type == "route_to_analyst"
+        assert event.compliance_level == "AI_Governance"
 
     def test_compliance_audit_trail(self):
         """Verify compliance events create retrievable audit trail."""
@@ -79,7 +79,7 @@ class TestComplianceTracking:
 
         # Should have all events
         assert len(tracker.audit_events) == 3
-        assert all("timestamp" in event for event in tracker.audit_events)
+        assert all(event.ts_ns for event in tracker.audit_events)
 
 
 class TestWorkflowMonitoring: